@@ -0,0 +1,45 @@
+"""Composite indexes for latest-signal/score lookups and SMALLINT scores
+
+Revision ID: 15b28667747c
+Revises: 326807e45859
+Create Date: 2026-10-17 05:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '15b28667747c'
+down_revision: Union[str, None] = '326807e45859'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The composite indexes lead with company_id, so the single-column
+    # company_id indexes become redundant
+    op.create_index('ix_tech_signals_company_type_date', 'tech_signals', ['company_id', 'signal_type', 'date'], unique=False)
+    op.drop_index('ix_tech_signals_company_id', table_name='tech_signals')
+    op.create_index('ix_ai_readiness_scores_company_generated', 'ai_readiness_scores', ['company_id', 'generated_at'], unique=False)
+    op.drop_index('ix_ai_readiness_scores_company_id', table_name='ai_readiness_scores')
+
+    # Scores are bounded to 0-100
+    with op.batch_alter_table('tech_signals') as batch_op:
+        batch_op.alter_column('relevance_score', type_=sa.SmallInteger(), existing_type=sa.Integer(), existing_nullable=False)
+    with op.batch_alter_table('ai_readiness_scores') as batch_op:
+        batch_op.alter_column('overall_score', type_=sa.SmallInteger(), existing_type=sa.Integer(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('ai_readiness_scores') as batch_op:
+        batch_op.alter_column('overall_score', type_=sa.Integer(), existing_type=sa.SmallInteger(), existing_nullable=False)
+    with op.batch_alter_table('tech_signals') as batch_op:
+        batch_op.alter_column('relevance_score', type_=sa.Integer(), existing_type=sa.SmallInteger(), existing_nullable=False)
+
+    op.create_index('ix_ai_readiness_scores_company_id', 'ai_readiness_scores', ['company_id'], unique=False)
+    op.drop_index('ix_ai_readiness_scores_company_generated', table_name='ai_readiness_scores')
+    op.create_index('ix_tech_signals_company_id', 'tech_signals', ['company_id'], unique=False)
+    op.drop_index('ix_tech_signals_company_type_date', table_name='tech_signals')
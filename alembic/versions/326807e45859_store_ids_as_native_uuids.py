@@ -0,0 +1,76 @@
+"""Store ids as native UUIDs instead of 36-character strings
+
+Revision ID: 326807e45859
+Revises: 32c4c0140d40
+Create Date: 2026-10-17 05:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '326807e45859'
+down_revision: Union[str, None] = '32c4c0140d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs holding a company or row id
+ID_COLUMNS = [
+    ('companies', 'id'),
+    ('tech_signals', 'id'),
+    ('tech_signals', 'company_id'),
+    ('ai_readiness_scores', 'id'),
+    ('ai_readiness_scores', 'company_id'),
+]
+# Child tables referencing companies.id (Postgres default constraint names)
+FOREIGN_KEYS = [
+    ('tech_signals', 'tech_signals_company_id_fkey'),
+    ('ai_readiness_scores', 'ai_readiness_scores_company_id_fkey'),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # Cast in place to the 16-byte uuid type, the foreign keys have to
+        # be dropped while the referenced column changes type
+        for table, constraint in FOREIGN_KEYS:
+            op.drop_constraint(constraint, table, type_='foreignkey')
+        for table, column in ID_COLUMNS:
+            op.alter_column(table, column, type_=sa.Uuid(), postgresql_using=f'{column}::uuid')
+        for table, constraint in FOREIGN_KEYS:
+            op.create_foreign_key(constraint, table, 'companies', ['company_id'], ['id'])
+        return
+
+    # Other databases store sa.Uuid as 32 hex characters without hyphens
+    for table, column in ID_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = REPLACE({column}, '-', '')")
+    for table in ('companies', 'tech_signals', 'ai_readiness_scores'):
+        with op.batch_alter_table(table) as batch_op:
+            for column in (c for t, c in ID_COLUMNS if t == table):
+                batch_op.alter_column(column, type_=sa.Uuid(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, constraint in FOREIGN_KEYS:
+            op.drop_constraint(constraint, table, type_='foreignkey')
+        for table, column in ID_COLUMNS:
+            op.alter_column(table, column, type_=sa.String(length=36), postgresql_using=f'{column}::text')
+        for table, constraint in FOREIGN_KEYS:
+            op.create_foreign_key(constraint, table, 'companies', ['company_id'], ['id'])
+        return
+
+    for table in ('companies', 'tech_signals', 'ai_readiness_scores'):
+        with op.batch_alter_table(table) as batch_op:
+            for column in (c for t, c in ID_COLUMNS if t == table):
+                batch_op.alter_column(column, type_=sa.String(length=36), existing_nullable=False)
+    # Restore the hyphenated 8-4-4-4-12 form
+    for table, column in ID_COLUMNS:
+        op.execute(
+            f"UPDATE {table} SET {column} = "
+            f"SUBSTR({column}, 1, 8) || '-' || SUBSTR({column}, 9, 4) || '-' || "
+            f"SUBSTR({column}, 13, 4) || '-' || SUBSTR({column}, 17, 4) || '-' || SUBSTR({column}, 21)"
+        )
@@ -0,0 +1,40 @@
+"""Materialize readiness_category as an indexed column
+
+Revision ID: 75f863fa2983
+Revises: fa0b8b40c6bd
+Create Date: 2026-10-17 06:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '75f863fa2983'
+down_revision: Union[str, None] = 'fa0b8b40c6bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Added nullable, backfilled with the same thresholds as
+    # models.categorize_readiness, then made required
+    op.add_column('ai_readiness_scores', sa.Column('readiness_category', sa.String(length=20), nullable=True))
+    op.execute(
+        "UPDATE ai_readiness_scores SET readiness_category = CASE "
+        "WHEN overall_score >= 80 THEN 'Very Ready' "
+        "WHEN overall_score >= 60 THEN 'Ready' "
+        "WHEN overall_score >= 40 THEN 'Somewhat Ready' "
+        "ELSE 'Not Ready' END"
+    )
+    with op.batch_alter_table('ai_readiness_scores') as batch_op:
+        batch_op.alter_column('readiness_category', existing_type=sa.String(length=20), nullable=False)
+    op.create_index(op.f('ix_ai_readiness_scores_readiness_category'), 'ai_readiness_scores', ['readiness_category'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ai_readiness_scores_readiness_category'), table_name='ai_readiness_scores')
+    with op.batch_alter_table('ai_readiness_scores') as batch_op:
+        batch_op.drop_column('readiness_category')
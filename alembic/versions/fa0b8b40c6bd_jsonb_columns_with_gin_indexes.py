@@ -0,0 +1,52 @@
+"""Store JSON columns as JSONB with GIN indexes on Postgres
+
+Revision ID: fa0b8b40c6bd
+Revises: 15b28667747c
+Create Date: 2026-10-17 05:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fa0b8b40c6bd'
+down_revision: Union[str, None] = '15b28667747c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ('tech_signals', 'tech_keywords'),
+    ('ai_readiness_scores', 'component_scores'),
+    ('ai_readiness_scores', 'recommendations'),
+    ('ai_readiness_scores', 'decision_makers'),
+    ('ai_readiness_scores', 'data_sources_used'),
+]
+GIN_INDEXES = [
+    ('ix_tech_signals_keywords_gin', 'tech_signals', 'tech_keywords'),
+    ('ix_ai_readiness_scores_sources_gin', 'ai_readiness_scores', 'data_sources_used'),
+]
+
+
+def upgrade() -> None:
+    # JSONB only exists on Postgres, other databases keep plain JSON
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, column in JSON_COLUMNS:
+        op.alter_column(table, column, type_=postgresql.JSONB(), postgresql_using=f'{column}::jsonb')
+    for name, table, column in GIN_INDEXES:
+        op.create_index(name, table, [column], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, table, column in GIN_INDEXES:
+        op.drop_index(name, table_name=table)
+    for table, column in JSON_COLUMNS:
+        op.alter_column(table, column, type_=sa.JSON(), postgresql_using=f'{column}::json')
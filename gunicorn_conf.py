@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for production deployments
+Usage: gunicorn -c gunicorn_conf.py
+"""
+
+import multiprocessing
+import os
+
+# The FastAPI app lives in src/main.py
+pythonpath = "src"
+wsgi_app = "main:app"
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# One event loop per process so scoring/serialization spreads across cores
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_class = "uvicorn_worker.ProspectUvicornWorker"
+
+# Pending connections queued by the kernel before new ones are refused
+backlog = 2048
+keepalive = 5
+graceful_timeout = 30
+
+# Recycle workers periodically to bound memory growth
+max_requests = 10000
+max_requests_jitter = 1000
+
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -58,6 +58,7 @@ def main():
         ("News Service", tests_dir / "test_news_service.py"),
         ("PDF Generation", tests_dir / "test_pdf_generation.py"),
         ("API Integration", tests_dir / "test_integration.py"),
+        ("Analysis Cache", tests_dir / "test_cache.py"),
     ]
     
     # Run all tests
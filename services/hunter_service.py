@@ -6,6 +6,7 @@ Free tier: 25 searches/month
 import os
 import httpx
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
@@ -57,21 +58,33 @@ class HunterService:
     
     BASE_URL = "https://api.hunter.io/v2"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Hunter service
         
         Args:
             api_key: Hunter.io API key (defaults to environment variable)
+            client: Shared HTTP client for connection reuse (defaults to a client per call)
         """
         self.api_key = api_key or os.getenv("HUNTER_API_KEY")
         if not self.api_key:
             logger.warning("No Hunter.io API key provided. Service will use mock data.")
         
+        self.client = client
+        
         # Simple in-memory cache (domain -> (data, timestamp))
         self._cache: Dict[str, tuple[Optional[HunterDomainData], datetime]] = {}
         self._cache_ttl_hours = 24
     
+    @asynccontextmanager
+    async def _http_client(self):
+        """Yield the shared HTTP client, or a short-lived one when none was injected"""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
+    
     async def search_domain(self, domain: str) -> Optional[HunterDomainData]:
         """
         Search for company information by domain
@@ -99,7 +112,7 @@ class HunterService:
         
         try:
             # Make API request
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.BASE_URL}/domain-search",
                     params={
@@ -155,7 +168,7 @@ class HunterService:
             return self._get_mock_contacts(domain, department)
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 params = {
                     "domain": domain,
                     "api_key": self.api_key
@@ -390,11 +403,32 @@ class HunterService:
                 params={"api_key": self.api_key}
             )
             if response.status_code == 200:
-                data = response.json()["data"]
-                return {
-                    "searches_left": data.get("requests", {}).get("searches", {}).get("available", 0),
-                    "plan": data.get("plan_name", "unknown")
-                }
+                return self._parse_account_info(response.json()["data"])
         except Exception as e:
             logger.error(f"Error getting account info: {e}")
-        return None
\ No newline at end of file
+        return None
+    
+    async def get_account_info_async(self) -> Optional[Dict[str, Any]]:
+        """Get Hunter.io account information without blocking the event loop"""
+        if not self.api_key:
+            return {"searches_left": "∞ (mock mode)", "plan": "demo"}
+        
+        try:
+            async with self._http_client() as client:
+                response = await client.get(
+                    f"{self.BASE_URL}/account",
+                    params={"api_key": self.api_key},
+                    timeout=10.0
+                )
+                if response.status_code == 200:
+                    return self._parse_account_info(response.json()["data"])
+        except Exception as e:
+            logger.error(f"Error getting account info: {e}")
+        return None
+    
+    def _parse_account_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract remaining searches and plan from the account payload"""
+        return {
+            "searches_left": data.get("requests", {}).get("searches", {}).get("available", 0),
+            "plan": data.get("plan_name", "unknown")
+        }
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+In-process TTL cache used to short-circuit repeated analyses, optionally
+backed by Redis so entries are shared across workers
+"""
+
+import asyncio
+import logging
+import math
+import operator
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import orjson
+
+from services.coalesce import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Cross-worker compute lock: held at most this long (longer than a
+# comprehensive analysis takes), polled by workers waiting for the result
+LOCK_TIMEOUT_SECONDS = 60
+LOCK_POLL_SECONDS = 0.2
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache with per-entry expiry
+    Concurrent misses for the same key are coalesced into a single computation
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl_seconds: int = 240,
+        redis: Optional[Any] = None,
+        namespace: str = "cache",
+        serialize: Callable[[Any], bytes] = orjson.dumps,
+        deserialize: Callable[[bytes], Any] = orjson.loads
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries kept before the oldest is evicted
+            ttl_seconds: Seconds an entry stays valid after it was stored
+            redis: Optional redis.asyncio client shared by every worker, checked
+                on a local miss before computing
+            namespace: Prefix for this cache's Redis keys
+            serialize: Encodes values for Redis
+            deserialize: Decodes values read from Redis
+        """
+        self.maxsize = maxsize
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.redis = redis
+        self.namespace = namespace
+        self.serialize = serialize
+        self.deserialize = deserialize
+
+        # Insertion-ordered store (key -> (value, timestamp))
+        self._cache: Dict[Hashable, tuple[Any, datetime]] = {}
+
+        # Pending computations, shared by every concurrent caller of a key
+        self._pending = SingleFlight()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value from the cache if it has not expired"""
+        if key in self._cache:
+            value, timestamp = self._cache[key]
+            if datetime.now() - timestamp < self.ttl:
+                return value
+            else:
+                # Entry expired
+                del self._cache[key]
+        return None
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the oldest entry when full"""
+        self._cache.pop(key, None)
+        if len(self._cache) >= self.maxsize:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (value, datetime.now())
+
+    def _redis_key(self, key: Hashable) -> str:
+        """Build the Redis key for a cache key"""
+        parts = key if isinstance(key, tuple) else (key,)
+        return ":".join([self.namespace, *map(str, parts)])
+
+    async def _get_shared(self, key: Hashable) -> Optional[Any]:
+        """Read a value from Redis, treating any Redis failure as a miss"""
+        try:
+            data = await self.redis.get(self._redis_key(key))
+        except Exception as e:
+            logger.warning("Redis read failed for %s: %s", key, e)
+            return None
+        return self.deserialize(data) if data is not None else None
+
+    async def _set_shared(self, key: Hashable, value: Any):
+        """Write a value to Redis with the cache TTL, ignoring Redis failures"""
+        try:
+            await self.redis.set(
+                self._redis_key(key),
+                self.serialize(value),
+                ex=int(self.ttl.total_seconds())
+            )
+        except Exception as e:
+            logger.warning("Redis write failed for %s: %s", key, e)
+
+    async def _acquire_lock(self, key: Hashable) -> Optional[str]:
+        """
+        Claim the cross-worker compute lock for key
+
+        Returns:
+            Token to release the lock with, None if another worker holds it.
+            An empty token means Redis failed and the caller computes unlocked
+        """
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis.set(
+                f"lock:{self._redis_key(key)}", token, nx=True, ex=LOCK_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            logger.warning("Redis lock failed for %s: %s", key, e)
+            return ""
+        return token if acquired else None
+
+    async def _release_lock(self, key: Hashable, token: str):
+        """Release the compute lock if this worker still holds it"""
+        lock_key = f"lock:{self._redis_key(key)}"
+        try:
+            held = await self.redis.get(lock_key)
+            if held is not None and (held.decode() if isinstance(held, bytes) else held) == token:
+                await self.redis.delete(lock_key)
+        except Exception as e:
+            logger.warning("Redis unlock failed for %s: %s", key, e)
+
+    async def _wait_for_shared(self, key: Hashable) -> Optional[Any]:
+        """
+        Wait for the worker holding the compute lock to store its result
+
+        Returns:
+            The shared value, None if the lock was released (or expired)
+            without one and the caller should compute it itself
+        """
+        lock_key = f"lock:{self._redis_key(key)}"
+        deadline = asyncio.get_running_loop().time() + LOCK_TIMEOUT_SECONDS
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+            value = await self._get_shared(key)
+            if value is not None:
+                return value
+            try:
+                if not await self.redis.exists(lock_key):
+                    return None
+            except Exception as e:
+                logger.warning("Redis lock check failed for %s: %s", key, e)
+                return None
+        return None
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        refresh: bool = False
+    ) -> Any:
+        """
+        Return the cached value for key, computing it on a miss
+
+        Concurrent callers with the same key are batched onto the first
+        caller's computation and all resolve from the same result, so a
+        burst of identical requests makes a single upstream fan-out.
+        With Redis, a lock extends this across workers: a worker that misses
+        while another computes the key waits for the shared result.
+        Exceptions are shared with the waiters and never cached.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument coroutine factory producing the value
+            cacheable: Optional predicate deciding whether a computed value is
+                stored (e.g. to skip fallback results returned on errors)
+            refresh: Skip cached values and recompute, storing the new result
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if not refresh:
+            cached = self.get(key)
+            if cached is not None:
+                logger.info("Cache hit for %s", key)
+                return cached
+
+        return await self._pending.run(key, lambda: self._load(key, compute, cacheable, refresh))
+
+    async def _load(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Optional[Callable[[Any], bool]],
+        refresh: bool
+    ) -> Any:
+        """Resolve a local miss from Redis or compute, storing the result"""
+        lock_token = None
+        try:
+            value = None
+            if self.redis is not None and not refresh:
+                value = await self._get_shared(key)
+                if value is None:
+                    lock_token = await self._acquire_lock(key)
+                    if lock_token is None:
+                        value = await self._wait_for_shared(key)
+            if value is not None:
+                logger.info("Shared cache hit for %s", key)
+                self.set(key, value)
+                return value
+            value = await compute()
+            if value is not None and (cacheable is None or cacheable(value)):
+                self.set(key, value)
+                if self.redis is not None:
+                    await self._set_shared(key, value)
+            return value
+        finally:
+            if lock_token:
+                await self._release_lock(key, lock_token)
+
+    def clear(self):
+        """Clear the entire cache"""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class SemanticCache:
+    """
+    Bounded nearest-neighbour cache over embedding vectors
+    A lookup returns the value stored for the most similar vector when its
+    cosine similarity clears the threshold, the oldest entries are evicted first
+    """
+
+    def __init__(self, maxsize: int = 256, threshold: float = 0.95):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._entries: List[Tuple[Tuple[float, ...], Any]] = []
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Tuple[float, ...]:
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        return tuple(x / norm for x in embedding)
+
+    def get(self, embedding: Sequence[float]) -> Optional[Any]:
+        """Value of the closest stored embedding, None if nothing is similar enough"""
+        if not self._entries:
+            return None
+        query = self._normalize(embedding)
+        # Vectors are unit length, so the dot product is the cosine similarity
+        similarity, value = max(
+            ((sum(map(operator.mul, vector, query)), value) for vector, value in self._entries),
+            key=operator.itemgetter(0)
+        )
+        if similarity >= self.threshold:
+            logger.info("Semantic cache hit (similarity %.3f)", similarity)
+            return value
+        return None
+
+    def set(self, embedding: Sequence[float], value: Any):
+        """Store a value under an embedding, evicting the oldest entry when full"""
+        self._entries.append((self._normalize(embedding), value))
+        if len(self._entries) > self.maxsize:
+            del self._entries[0]
+
+    def clear(self):
+        """Clear the entire cache"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -14,11 +14,25 @@ load_dotenv()
 # Database URL from environment or default to SQLite
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./prospect_intelligence.db")
 
+IS_SQLITE = "sqlite" in DATABASE_URL
+
+# Connection pool for server databases: reuse connections across requests,
+# check them before use and recycle them before idle timeouts (e.g. RDS)
+# drop them. SQLite keeps SQLAlchemy's default file-based pool
+POOL_OPTIONS = {} if IS_SQLITE else {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
-    echo=False  # Set to True for SQL query logging during development
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    echo=False,  # Set to True for SQL query logging during development
+    **POOL_OPTIONS
 )
 
 # Create SessionLocal class
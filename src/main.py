@@ -3,26 +3,35 @@ Prospect Intelligence Tool - Main FastAPI Application
 For ModelML Sales Demo
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, Request
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, validator
-from typing import Optional, Dict, Any
+from starlette.background import BackgroundTask
+from starlette.websockets import WebSocketState
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, Dict, Any, AsyncIterator
+from contextlib import asynccontextmanager
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import uvicorn
+import asyncio
+import atexit
+import functools
+import hashlib
+import httpx
+import orjson
 import os
+import sys
 from dotenv import load_dotenv
 from services.clearbit_service import ClearbitService
 from services.hunter_service import HunterService
 from services.web_scraper import WebScraperService
-from services.scoring_engine import AIReadinessScoringEngine
+from services.scoring_engine import AIReadinessScoringEngine, quick_hunter_score, quick_clearbit_score
 from services.financial_scoring_engine import FinancialAIReadinessScoringEngine
 from services.job_posting_service import JobPostingService
-from services.report_generator import PDFReportGenerator
-from services.enhanced_report_generator import EnhancedPDFReportGenerator
 from services.news_service import NewsService
 from services.company_database import CompanyDatabase
 from services.decision_maker_service import DecisionMakerService
@@ -30,22 +39,119 @@ from services.brightdata_service import BrightDataService
 from services.brightdata_linkedin_service import BrightDataLinkedInService
 from services.brightdata_correct_service import BrightDataCorrectService
 from services.ai_recommendation_service import AIRecommendationService
+from cache import TTLCache, SemanticCache
+from progress import ProgressBroker
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Served as "main:app" by uvicorn (see __main__ below) and gunicorn_conf.py
+__all__ = ["app"]
 
 # Load environment variables
 load_dotenv()
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Configure logging: handlers only enqueue records, a background listener
+# thread does the formatting and stderr writes off the event loop.
+# LOG_LEVEL=WARNING drops the per-request info lines under load
+log_queue = queue.Queue(-1)
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+log_listener = QueueListener(log_queue, log_stream_handler)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[QueueHandler(log_queue)])
+log_listener.start()
+
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread, safe to call more than once"""
+    if log_listener._thread is not None:
+        log_listener.stop()
+
+# Stopped once at interpreter exit rather than per lifespan, so records
+# logged at import time or by a later lifespan (tests, reloads) still flush
+atexit.register(_stop_log_listener)
+logger = logging.getLogger(__name__)
+
+# Optional Redis shared by every worker, backs the rate limits and caches
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Initialize rate limiter, counting in Redis when configured so the limits
+# hold across workers instead of applying per process
+limiter = Limiter(key_func=get_remote_address, storage_uri=REDIS_URL or "memory://")
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (much faster on large nested payloads)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+# Keep pool warmup from holding up worker startup when an API is unreachable
+WARMUP_TIMEOUT_SECONDS = 3.0
+
+async def _warm_up_connections(http_client: httpx.AsyncClient, services: tuple):
+    """Open connections (DNS, TCP, TLS) to the configured API hosts before traffic arrives"""
+    urls = [service.BASE_URL for service in services if service.api_key]
+    results = await asyncio.gather(
+        *[http_client.head(url, timeout=WARMUP_TIMEOUT_SECONDS) for url in urls],
+        return_exceptions=True
+    )
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.warning("Connection warmup failed for %s: %s", url, result)
+
+def _raise_open_file_limit():
+    """Raise the soft open-file limit to the hard limit, every connection holds a descriptor"""
+    if sys.platform == "win32":
+        return
+    import resource
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError) as e:
+            logger.warning("Could not raise open file limit from %s: %s", soft, e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Share one pooled HTTP client across the outbound services so repeated
+    calls to the same hosts reuse keep-alive connections, warming the pool
+    before the worker starts serving
+    """
+    # Serve the web interface from memory in production, re-read it per
+    # request while developing so edits show up without a restart
+    app.state.index_html = _load_index_html() if os.getenv("ENVIRONMENT") == "production" else None
+    _raise_open_file_limit()
+    
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+    ) as http_client:
+        app.state.http_client = http_client
+        pooled_services = (
+            hunter_service, clearbit_service, web_scraper, job_posting_service, news_service,
+            brightdata_service, brightdata_linkedin_service, brightdata_correct_service,
+            ai_recommendation_service
+        )
+        for service in pooled_services:
+            service.client = http_client
+        await _warm_up_connections(http_client, (hunter_service, clearbit_service, ai_recommendation_service))
+        try:
+            yield
+        finally:
+            for service in pooled_services:
+                service.client = None
+            if redis_client is not None:
+                await redis_client.aclose()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Prospect Intelligence Tool",
     description="Automated AI readiness assessment for ModelML prospects",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add rate limit error handler
@@ -60,16 +166,13 @@ web_scraper = WebScraperService()
 scoring_engine = AIReadinessScoringEngine()
 financial_scoring_engine = FinancialAIReadinessScoringEngine()
 job_posting_service = JobPostingService()
-pdf_generator = PDFReportGenerator()
 # Use appropriate directory based on environment
-import os
 if os.environ.get('VERCEL') or os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
     # Use /tmp for serverless environments
     reports_dir = "/tmp/reports"
 else:
     # Use local reports directory for development
     reports_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports")
-enhanced_pdf_generator = EnhancedPDFReportGenerator(output_dir=reports_dir)
 news_service = NewsService()
 company_database = CompanyDatabase()
 decision_maker_service = DecisionMakerService()
@@ -78,67 +181,125 @@ brightdata_linkedin_service = BrightDataLinkedInService()
 brightdata_correct_service = BrightDataCorrectService()
 ai_recommendation_service = AIRecommendationService()
 
+@functools.cache
+def get_pdf_generator():
+    """
+    Build the PDF report generator on first use
+    ReportLab is slow to import and only /generate-report needs it, so workers
+    that never render a report don't pay for it at boot
+    """
+    from services.enhanced_report_generator import EnhancedPDFReportGenerator
+    return EnhancedPDFReportGenerator(output_dir=reports_dir)
+
+# Redis behind the in-process caches, so a company analyzed once isn't
+# re-fetched by the other workers (or instances)
+if REDIS_URL:
+    import redis.asyncio as aioredis
+    redis_client = aioredis.Redis.from_url(REDIS_URL)
+else:
+    redis_client = None
+
+# Short-lived cache of analysis responses so repeated lookups of the same
+# company don't re-hit Hunter.io/Clearbit quotas
+ANALYSIS_CACHE_TTL_SECONDS = 240
+analysis_cache = TTLCache(
+    maxsize=1024,
+    ttl_seconds=ANALYSIS_CACHE_TTL_SECONDS,
+    redis=redis_client,
+    namespace="analysis",
+    serialize=bytes,  # Entries are already serialized JSON
+    deserialize=bytes
+)
+
+# Per-source caches for the upstream lookups the services don't cache
+# themselves (Hunter.io, Clearbit and job postings keep their own 24h caches)
+web_data_cache = TTLCache(maxsize=1024, ttl_seconds=24 * 3600, redis=redis_client, namespace="web")
+news_cache = TTLCache(maxsize=1024, ttl_seconds=3600, redis=redis_client, namespace="news")
+brightdata_cache = TTLCache(maxsize=1024, ttl_seconds=24 * 3600, redis=redis_client, namespace="brightdata")
+
+# Deterministic OpenAI completions keyed by prompt hash (see AIRecommendationService)
+llm_cache = TTLCache(maxsize=1024, ttl_seconds=24 * 3600, redis=redis_client, namespace="llm")
+ai_recommendation_service.cache = llm_cache
+
+# Opt-in reuse of recommendations across near-identical prospects, set the
+# cosine similarity threshold (e.g. 0.95) to enable
+if os.getenv("SEMANTIC_CACHE_THRESHOLD"):
+    ai_recommendation_service.semantic_cache = SemanticCache(
+        maxsize=256, threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD"))
+    )
+
+# Comprehensive analysis progress, relayed to /ws clients on any worker
+progress_broker = ProgressBroker(redis_client)
+
 # Log active data sources at startup
-logging.info("=" * 60)
-logging.info("PROSPECT INTELLIGENCE - DATA SOURCE STATUS")
-logging.info("=" * 60)
+logger.info("=" * 60)
+logger.info("PROSPECT INTELLIGENCE - DATA SOURCE STATUS")
+logger.info("=" * 60)
 
 # Check Hunter.io
 if os.getenv("HUNTER_API_KEY") and os.getenv("HUNTER_API_KEY") != "your_hunter_api_key_here":
-    logging.info("✅ Hunter.io API: Active (Real company data)")
+    logger.info("✅ Hunter.io API: Active (Real company data)")
 else:
-    logging.info("⚠️  Hunter.io API: Not configured (will use fallback)")
+    logger.info("⚠️  Hunter.io API: Not configured (will use fallback)")
 
 # Check Clearbit
 if os.getenv("CLEARBIT_API_KEY") and os.getenv("CLEARBIT_API_KEY") != "your_clearbit_api_key_here":
-    logging.info("✅ Clearbit API: Active (Real company data)")
+    logger.info("✅ Clearbit API: Active (Real company data)")
 else:
-    logging.info("⚠️  Clearbit API: Not configured (optional)")
+    logger.info("⚠️  Clearbit API: Not configured (optional)")
 
 # Check NewsAPI
 if os.getenv("NEWS_API_KEY") and os.getenv("NEWS_API_KEY") != "your_newsapi_key_here":
-    logging.info("✅ NewsAPI: Active (Real news articles)")
+    logger.info("✅ NewsAPI: Active (Real news articles)")
 else:
-    logging.info("❌ NewsAPI: Not configured (required)")
+    logger.info("❌ NewsAPI: Not configured (required)")
 
 # Check RapidAPI/JSearch
 if os.getenv("RAPIDAPI_KEY") and os.getenv("RAPIDAPI_KEY") != "your_rapidapi_key_here":
-    logging.info("✅ RapidAPI/JSearch: Active (Real job postings)")
+    logger.info("✅ RapidAPI/JSearch: Active (Real job postings)")
 else:
-    logging.info("❌ RapidAPI: Not configured (required)")
+    logger.info("❌ RapidAPI: Not configured (required)")
 
 # Check OpenAI
-if os.getenv("OPENAI_API_KEY") and os.getenv("OPENAI_API_KEY") != "your_openai_api_key_here":
-    logging.info("✅ OpenAI API: Active (AI-powered recommendations)")
+if ai_recommendation_service.api_key and ai_recommendation_service.api_key != "your_openai_api_key_here":
+    logger.info("✅ OpenAI API: Active (AI-powered recommendations, %s key(s))", len(ai_recommendation_service.api_keys))
 else:
-    logging.info("⚠️  OpenAI API: Not configured (will use templates)")
+    logger.info("⚠️  OpenAI API: Not configured (will use templates)")
 
 # Web scraping is always available
-logging.info("✅ Web Scraping: Active (Real website data)")
+logger.info("✅ Web Scraping: Active (Real website data)")
 
 # BrightData is intentionally disabled
-logging.info("ℹ️  BrightData: DISABLED - Using mock data (for performance)")
+logger.info("ℹ️  BrightData: DISABLED - Using mock data (for performance)")
 
-logging.info("=" * 60)
+logger.info("=" * 60)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Compress larger responses (comprehensive analyses are many KB of repetitive JSON)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS
+# Comma-separated list of allowed origins, any origin when unset
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()] or ["*"]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],  # The only methods the API exposes
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Request/Response Models
 class CompanyRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=200, description="Company name")
-    domain: Optional[str] = Field(None, pattern=r'^[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9]?\.[a-zA-Z]{2,}$', description="Company domain")
+    domain: Optional[str] = Field(None, max_length=253, pattern=r'^[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9]?\.[a-zA-Z]{2,}$', description="Company domain")
     
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         if not v or not v.strip():
             raise ValueError('Company name cannot be empty')
@@ -157,37 +318,128 @@ class ProspectAnalysisResponse(BaseModel):
     message: str
     company_data: Optional[Dict[str, Any]] = None
 
+# Static payloads never change, so encode them once at import and only
+# wrap the bytes in a fresh Response per request
+HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "version": "1.0.0",
+    "message": "All systems operational"
+})
+
+API_DOCS_BYTES = orjson.dumps({
+    "endpoints": {
+        "/": "Health check",
+        "/health": "Detailed health check",
+        "/analyze": "POST - Analyze company AI readiness",
+        "/api/docs": "This documentation",
+        "/api/account": "Hunter.io account info and remaining searches"
+    },
+    "version": "1.0.0"
+})
+
+# Probes may reuse a health result briefly, the docs only change on deploy
+# so clients revalidate them with the ETag
+HEALTH_CACHE_HEADERS = {"Cache-Control": "public, max-age=10"}
+API_DOCS_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": f'"{hashlib.sha1(API_DOCS_BYTES).hexdigest()}"'
+}
+
+def _load_index_html() -> Optional[bytes]:
+    """Read the web interface, None if it is missing"""
+    try:
+        with open("static/index.html", "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+# Let browsers and proxies reuse the in-memory web interface for a few minutes
+INDEX_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
-async def root():
+async def root(request: Request):
     """Serve the main web interface"""
-    try:
-        with open("static/index.html", "r") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
+    index_html = getattr(request.app.state, "index_html", None)
+    if index_html is not None:
+        return HTMLResponse(content=index_html, headers=INDEX_CACHE_HEADERS)
+    
+    index_html = _load_index_html()
+    if index_html is None:
         return HTMLResponse(content="<h1>Web interface not found. Please check static/index.html</h1>", status_code=404)
+    return HTMLResponse(content=index_html)
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        version="1.0.0",
-        message="All systems operational"
-    )
+    return Response(content=HEALTH_BYTES, media_type="application/json", headers=HEALTH_CACHE_HEADERS)
+
+def _analysis_cache_key(endpoint: str, company: CompanyRequest) -> tuple:
+    """Build the analysis cache key from the domain, falling back to the name"""
+    return (endpoint, company.domain.lower() if company.domain else company.name.lower())
+
+# Baseline response when there is no domain to look up (or no data for it)
+LIMITED_DATA_TEMPLATE = ProspectAnalysisResponse(
+    company_name="",
+    ai_readiness_score=50,
+    confidence=0.3,
+    message="",
+    company_data=None
+)
+
+def _limited_data_response(company_name: str, domain: Optional[str]) -> ProspectAnalysisResponse:
+    """Copy the baseline response for a company without re-validating it"""
+    return LIMITED_DATA_TEMPLATE.model_copy(update={
+        "company_name": company_name,
+        "domain": domain,
+        "message": f"Limited data available for {company_name}. Provide domain for better analysis."
+    })
+
+# The same baseline as a plain dict, for answering without building a model
+LIMITED_DATA_DICT = LIMITED_DATA_TEMPLATE.model_dump(mode="json")
+
+def _limited_data_json(company_name: str, domain: Optional[str]) -> bytes:
+    """Serialize the baseline response for a company straight from the dict template"""
+    return orjson.dumps({
+        **LIMITED_DATA_DICT,
+        "company_name": company_name,
+        "domain": domain,
+        "message": f"Limited data available for {company_name}. Provide domain for better analysis."
+    }, option=ORJSON_OPTIONS)
 
 @app.post("/analyze", response_model=ProspectAnalysisResponse)
 @limiter.limit("10/minute")
-async def analyze_prospect(request: Request, company: CompanyRequest):
+async def analyze_prospect(request: Request, company: CompanyRequest, fresh: bool = False):
     """
     Analyze a company's AI readiness
     
     Args:
         company: CompanyRequest with company name and optional domain
+        fresh: Bypass the cached response and re-run the analysis
     
     Returns:
         ProspectAnalysisResponse with AI readiness score and details
     """
+    # Nothing to look up without a domain, skip the cache and upstream calls.
+    # Every path returns serialized bytes, response_model only documents the schema
+    if not company.domain:
+        return Response(content=_limited_data_json(company.name, company.domain), media_type="application/json")
+    
+    # Cached as serialized JSON so a hit skips response validation and encoding
+    body = await analysis_cache.get_or_compute(
+        _analysis_cache_key("analyze", company),
+        lambda: _prospect_analysis_json(company),
+        refresh=fresh
+    )
+    return Response(content=body, media_type="application/json")
+
+async def _prospect_analysis_json(company: CompanyRequest) -> bytes:
+    """Run the quick analysis and serialize it once for the cache"""
+    analysis = await _run_prospect_analysis(company)
+    return orjson.dumps(analysis.model_dump(mode="json"), option=ORJSON_OPTIONS)
+
+async def _run_prospect_analysis(company: CompanyRequest) -> ProspectAnalysisResponse:
+    """Run the quick analysis against Hunter.io with Clearbit fallback"""
     try:
         company_data = None
         score = 50  # Base score
@@ -218,42 +470,12 @@ async def analyze_prospect(request: Request, company: CompanyRequest):
                 }
                 
                 # Calculate AI readiness score based on Hunter.io data
-                score = 40  # Base score
-                
-                # Company size scoring
-                if hunter_data.company_size:
-                    if "10000+" in hunter_data.company_size:
-                        score += 20
-                    elif "1000" in hunter_data.company_size:
-                        score += 15
-                    elif "100" in hunter_data.company_size or "500" in hunter_data.company_size:
-                        score += 12
-                    else:
-                        score += 8
-                
-                # Technology stack scoring
-                if hunter_data.technologies:
-                    ai_keywords = ["tensorflow", "pytorch", "python", "aws", "ml", "ai", "data", "kubernetes", "docker"]
-                    tech_lower = [t.lower() for t in hunter_data.technologies]
-                    ai_tech_count = sum(1 for keyword in ai_keywords if any(keyword in tech for tech in tech_lower))
-                    score += min(ai_tech_count * 4, 25)
-                
-                # Industry scoring
-                if hunter_data.company_industry:
-                    industry_lower = hunter_data.company_industry.lower()
-                    if any(x in industry_lower for x in ["artificial", "ai", "machine learning", "technology"]):
-                        score += 15
-                    elif any(x in industry_lower for x in ["software", "internet", "financial", "banking"]):
-                        score += 10
-                    else:
-                        score += 5
-                
-                # Executive contacts bonus
-                if hunter_data.contacts:
-                    executive_count = sum(1 for c in hunter_data.contacts if c.get("seniority") == "executive")
-                    score += min(executive_count * 3, 10)
-                
-                score = min(score, 100)
+                score = quick_hunter_score(
+                    hunter_data.company_size,
+                    hunter_data.technologies,
+                    hunter_data.company_industry,
+                    hunter_data.contacts
+                )
                 confidence = 0.8
                 
                 return ProspectAnalysisResponse(
@@ -281,22 +503,7 @@ async def analyze_prospect(request: Request, company: CompanyRequest):
                     }
                     
                     # Scoring based on Clearbit data
-                    score = 50
-                    if clearbit_data.employee_count:
-                        if clearbit_data.employee_count > 1000:
-                            score += 20
-                        elif clearbit_data.employee_count > 100:
-                            score += 15
-                        else:
-                            score += 10
-                    
-                    if clearbit_data.tech_stack:
-                        ai_keywords = ["tensorflow", "pytorch", "scikit", "ml", "ai", "data"]
-                        tech_lower = [t.lower() for t in clearbit_data.tech_stack]
-                        ai_tech_count = sum(1 for keyword in ai_keywords if any(keyword in tech for tech in tech_lower))
-                        score += min(ai_tech_count * 5, 20)
-                    
-                    score = min(score, 100)
+                    score = quick_clearbit_score(clearbit_data.employee_count, clearbit_data.tech_stack)
                     confidence = 0.75
                     
                     return ProspectAnalysisResponse(
@@ -308,38 +515,24 @@ async def analyze_prospect(request: Request, company: CompanyRequest):
                         company_data=company_data
                     )
         
-        # No domain provided or no data found
-        return ProspectAnalysisResponse(
-            company_name=company_name,
-            domain=company.domain,
-            ai_readiness_score=50,
-            confidence=0.3,
-            message=f"Limited data available for {company_name}. Provide domain for better analysis.",
-            company_data=None
-        )
+        # No data found for the domain
+        return _limited_data_response(company_name, company.domain)
         
     except Exception as e:
-        logging.error(f"Error analyzing prospect: {e}")
+        logger.exception("Error analyzing prospect")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @app.get("/api/docs")
-async def api_documentation():
+async def api_documentation(request: Request):
     """API documentation endpoint"""
-    return {
-        "endpoints": {
-            "/": "Health check",
-            "/health": "Detailed health check",
-            "/analyze": "POST - Analyze company AI readiness",
-            "/api/docs": "This documentation",
-            "/api/account": "Hunter.io account info and remaining searches"
-        },
-        "version": "1.0.0"
-    }
+    if request.headers.get("if-none-match") == API_DOCS_HEADERS["ETag"]:
+        return Response(status_code=304, headers=API_DOCS_HEADERS)
+    return Response(content=API_DOCS_BYTES, media_type="application/json", headers=API_DOCS_HEADERS)
 
 @app.get("/api/account")
 async def account_info():
     """Get Hunter.io account information and remaining searches"""
-    account = hunter_service.get_account_info()
+    account = await hunter_service.get_account_info_async()
     return {
         "hunter_io": account if account else {"status": "No API key configured, using mock data"},
         "message": "Hunter.io provides 25 free searches/month. Sign up at https://hunter.io/users/sign-up"
@@ -347,79 +540,178 @@ async def account_info():
 
 @app.post("/analyze/comprehensive")
 @limiter.limit("10/minute")
-async def analyze_comprehensive(request: Request, company: CompanyRequest):
+async def analyze_comprehensive(
+    request: Request,
+    company: CompanyRequest,
+    fresh: bool = False,
+    progress_id: Optional[str] = None
+):
     """
     Comprehensive AI readiness analysis using all data sources
+    Pass fresh=true to bypass the cached response and re-run the analysis,
+    and a progress_id to stream stage updates to /ws?progress_id=...
     """
+    # Cached as serialized JSON so a hit is returned without FastAPI's
+    # jsonable_encoder pass or re-encoding the large payload
+    # Subscribers wait for a terminal "complete" or "error" update, so one
+    # is always published, even when the analysis fails or is cancelled
+    outcome = ("error", "Analysis failed", 100)
     try:
-        # 1. Collect data from Hunter.io
-        hunter_data = None
-        if company.domain:
-            hunter_result = await hunter_service.search_domain(company.domain)
-            if hunter_result:
-                hunter_data = {
-                    "organization": hunter_result.organization,
-                    "industry": hunter_result.company_industry,
-                    "size": hunter_result.company_size,
-                    "location": f"{hunter_result.city}, {hunter_result.state} {hunter_result.country}".strip(),
-                    "key_contacts": hunter_result.contacts[:5] if hunter_result.contacts else [],
-                    "technologies": hunter_result.technologies if hunter_result.technologies else []
-                }
-        
-        # 2. Scrape website for tech signals
-        web_data = None
-        if company.domain:
-            web_data = await web_scraper.scrape_company_website(company.domain)
-        
-        # 3. Collect job posting data
-        job_data = None
-        if company.name:
-            job_data = await job_posting_service.search_company_jobs(company.name)
-        
-        # 4. Try Clearbit as fallback for additional data
-        clearbit_data = None
-        if company.domain and not hunter_data:
-            clearbit_result = await clearbit_service.get_company_data(company.domain)
-            if clearbit_result:
-                clearbit_data = {
-                    "name": clearbit_result.name,
-                    "industry": clearbit_result.industry,
-                    "employees": clearbit_result.employee_count,
-                    "tech_stack": clearbit_result.tech_stack
-                }
-        
-        # 5. Detect if it's a financial company
-        is_financial = financial_scoring_engine.detect_financial_company(
-            hunter_data=hunter_data,
-            clearbit_data=clearbit_data,
-            company_name=company.name
+        body = await analysis_cache.get_or_compute(
+            _analysis_cache_key("comprehensive", company),
+            lambda: _comprehensive_analysis_json(company, progress_id),
+            refresh=fresh
         )
-        
-        # 6. Collect news and press releases (with financial focus if applicable)
-        news_data = None
-        if company.name:
-            news_data = await news_service.get_company_news(
+        outcome = ("complete", "Analysis complete", 100)
+    finally:
+        await _publish_progress(progress_id, *outcome)
+    return Response(content=body, media_type="application/json")
+
+async def _comprehensive_analysis_json(company: CompanyRequest, progress_id: Optional[str] = None) -> bytes:
+    """Run the comprehensive analysis and serialize it once for the cache"""
+    return orjson.dumps(await _run_comprehensive_analysis(company, progress_id), option=ORJSON_OPTIONS)
+
+async def _publish_progress(progress_id: Optional[str], stage: str, message: str, progress: int):
+    """Publish a progress update for the analysis, if the client asked for them"""
+    if progress_id:
+        await progress_broker.publish(progress_id, {
+            "type": stage,
+            "message": message,
+            "progress": progress
+        })
+
+async def _none() -> None:
+    """Placeholder awaitable for a source that is skipped"""
+    return None
+
+def _log_source_failure(source: str, result: Any) -> Any:
+    """Turn a failed data source lookup into None, logging the error"""
+    if isinstance(result, Exception):
+        logger.error("Error collecting %s data: %s", source, result)
+        return None
+    return result
+
+async def _collect_profile_and_news(company: CompanyRequest) -> tuple:
+    """
+    Collect firmographics from Hunter.io (falling back to Clearbit), detect
+    whether the company is financial and fetch news with that focus
+    
+    Returns:
+        (hunter_data, clearbit_data, is_financial, news_data)
+    """
+    # 1. Collect data from Hunter.io
+    hunter_data = None
+    if company.domain:
+        hunter_result = await hunter_service.search_domain(company.domain)
+        if hunter_result:
+            hunter_data = {
+                "organization": hunter_result.organization,
+                "industry": hunter_result.company_industry,
+                "size": hunter_result.company_size,
+                "location": f"{hunter_result.city}, {hunter_result.state} {hunter_result.country}".strip(),
+                "key_contacts": hunter_result.contacts[:5] if hunter_result.contacts else [],
+                "technologies": hunter_result.technologies if hunter_result.technologies else []
+            }
+    
+    # 2. Try Clearbit as fallback for additional data
+    clearbit_data = None
+    if company.domain and not hunter_data:
+        clearbit_result = await clearbit_service.get_company_data(company.domain)
+        if clearbit_result:
+            clearbit_data = {
+                "name": clearbit_result.name,
+                "industry": clearbit_result.industry,
+                "employees": clearbit_result.employee_count,
+                "tech_stack": clearbit_result.tech_stack
+            }
+    
+    # 3. Detect if it's a financial company
+    is_financial = financial_scoring_engine.detect_financial_company(
+        hunter_data=hunter_data,
+        clearbit_data=clearbit_data,
+        company_name=company.name
+    )
+    
+    # 4. Collect news and press releases (with financial focus if applicable)
+    news_data = None
+    if company.name:
+        news_data = await news_cache.get_or_compute(
+            (company.name.lower(), is_financial),
+            lambda: news_service.get_company_news(
                 company.name, 
                 days_back=30,
                 is_financial=is_financial
-            )
+            ),
+            # Errors and rate limits fall back to mock news, never share those
+            cacheable=lambda data: data.get("data_source") == "NewsAPI"
+        )
+    
+    return hunter_data, clearbit_data, is_financial, news_data
+
+async def _run_comprehensive_analysis(company: CompanyRequest, progress_id: Optional[str] = None) -> Dict[str, Any]:
+    """Collect data from every source, score it and build the full response"""
+    try:
+        # Each source reports when it finishes, they complete in any order
+        sources_done = 0
+        
+        async def tracked(source: str, awaitable):
+            nonlocal sources_done
+            try:
+                return await awaitable
+            finally:
+                sources_done += 1
+                await _publish_progress(progress_id, "progress", f"{source} done", sources_done * 20)
+        
+        # 1-7. Collect data from every source concurrently. Hunter.io, the
+        # Clearbit fallback, financial detection and news depend on each other
+        # so they run as one chain alongside the independent lookups
+        results = await asyncio.gather(
+            tracked("Company profile and news", _collect_profile_and_news(company)),
+            tracked("Web scraping", web_data_cache.get_or_compute(
+                company.domain.lower(),
+                lambda: web_scraper.scrape_company_website(company.domain),
+                cacheable=lambda data: bool(data.get("domain"))  # Empty result means the scrape failed
+            ) if company.domain else _none()),
+            tracked("Job postings", job_posting_service.search_company_jobs(company.name) if company.name else _none()),
+            tracked("LinkedIn profiles", brightdata_cache.get_or_compute(
+                company.name.lower(),
+                lambda: brightdata_correct_service.search_linkedin_profiles(company.name)
+            ) if company.name else _none()),
+            return_exceptions=True
+        )
+        profile_result, *source_results = results
+        if isinstance(profile_result, BaseException):
+            # Core company data is required, fail like the sequential version did
+            raise profile_result
+        hunter_data, clearbit_data, is_financial, news_data = profile_result
+        web_data, job_data, brightdata_decision_makers = [
+            _log_source_failure(source, result)
+            for source, result in zip(("web scraping", "job postings", "BrightData"), source_results)
+        ]
+        brightdata_decision_makers = brightdata_decision_makers or []
+        
+        # Aggregate the BrightData profiles and build the LinkedIn decision
+        # makers for the top 3 in a single pass
+        total_connections = 0
+        total_followers = 0
+        recent_updates = []
+        linkedin_decision_makers = []
+        for i, profile in enumerate(brightdata_decision_makers):
+            total_connections += profile.get("connections", 0)
+            total_followers += profile.get("followers", 0)
+            if i < 3:
+                if profile.get("recent_activity"):
+                    recent_updates.append(profile["recent_activity"])
+                linkedin_decision_makers.append(decision_maker_service.build_linkedin_decision_maker(profile))
         
-        # 7. Get enhanced LinkedIn data from BrightData
         linkedin_company = None
-        brightdata_decision_makers = []
-        if company.name:
-            # Use the corrected BrightData service to search for decision makers
-            brightdata_decision_makers = await brightdata_correct_service.search_linkedin_profiles(company.name)
-            
-            # Extract company info from the first profile if available
-            if brightdata_decision_makers and len(brightdata_decision_makers) > 0:
-                first_profile = brightdata_decision_makers[0]
-                linkedin_company = {
-                    "name": company.name,
-                    "employee_count": sum(p.get("connections", 0) for p in brightdata_decision_makers),
-                    "follower_count": sum(p.get("followers", 0) for p in brightdata_decision_makers),
-                    "recent_updates": [p.get("recent_activity", "") for p in brightdata_decision_makers[:3] if p.get("recent_activity")]
-                }
+        if brightdata_decision_makers:
+            linkedin_company = {
+                "name": company.name,
+                "employee_count": total_connections,
+                "follower_count": total_followers,
+                "recent_updates": recent_updates
+            }
         
         # 8. Identify key decision makers (combine Hunter.io and BrightData)
         decision_makers = decision_maker_service.identify_decision_makers(
@@ -428,36 +720,9 @@ async def analyze_comprehensive(request: Request, company: CompanyRequest):
             is_financial=is_financial
         )
         
-        # Enhance with BrightData LinkedIn profiles
-        if brightdata_decision_makers:
-            for bd_dm in brightdata_decision_makers[:3]:  # Add top 3 from BrightData
-                skills = bd_dm.get("skills", [])
-                experience_years = bd_dm.get("experience_years", 0)
-                about = bd_dm.get("about", "")[:100] if bd_dm.get("about") else ""
-                
-                decision_makers.insert(0, {
-                    "name": bd_dm.get("name", "Unknown"),
-                    "title": bd_dm.get("title", "Unknown"),
-                    "email": "",  # LinkedIn doesn't provide emails
-                    "linkedin": bd_dm.get("linkedin_url", ""),
-                    "priority": 1,  # High priority for LinkedIn verified profiles
-                    "role": "LinkedIn Verified Profile",
-                    "approach": f"Personalized LinkedIn outreach - {bd_dm.get('title', 'Executive')}",
-                    "confidence": 95,
-                    "skills": skills,
-                    "experience_years": experience_years,
-                    "followers": bd_dm.get("followers", 0),
-                    "connections": bd_dm.get("connections", 0),
-                    "about_snippet": about,
-                    "recent_activity": bd_dm.get("recent_activity", ""),
-                    "education": bd_dm.get("education", ""),
-                    "talking_points": [
-                        f"Connect on expertise in {', '.join(skills[:2])}" if skills else "Discuss industry trends",
-                        f"Reference their {experience_years}+ years of experience" if experience_years > 0 else "Acknowledge their leadership role",
-                        f"Recent activity: {bd_dm.get('recent_activity', '')[:50]}" if bd_dm.get("recent_activity") else "ModelML's value for your role",
-                        "How ModelML accelerates AI initiatives at scale"
-                    ]
-                })
+        # LinkedIn verified profiles go first, reversed as the previous
+        # insert(0, ...) loop ordered them
+        decision_makers = linkedin_decision_makers[::-1] + decision_makers
         
         # 8. Calculate comprehensive score using appropriate engine
         if is_financial:
@@ -487,27 +752,37 @@ async def analyze_comprehensive(request: Request, company: CompanyRequest):
             "basic_info": hunter_data or clearbit_data or {}
         }
         
-        # Generate AI-powered sales recommendations
-        ai_recommendations = await ai_recommendation_service.generate_sales_recommendations(
-            company_name=company.name,
-            ai_readiness_score=scoring_result["overall_score"],
-            component_scores=scoring_result["component_scores"],
-            company_data=company_analysis_data,
-            decision_makers=decision_makers,
-            is_financial=is_financial
-        )
+        await _publish_progress(progress_id, "progress", "Scoring complete, generating recommendations", 85)
         
-        # Generate personalized outreach for top decision makers
-        personalized_outreach = []
-        for dm in decision_makers[:3]:  # Top 3 decision makers
-            outreach = await ai_recommendation_service.generate_personalized_outreach(
-                decision_maker=dm,
+        # Generate AI-powered sales recommendations and personalized outreach
+        # for the top 3 decision makers concurrently (independent LLM calls,
+        # all three outreach strategies come from a single prompt). Generated
+        # at temperature 0 so repeat analyses of unchanged data hit llm_cache
+        top_decision_makers = decision_makers[:3]
+        key_insights = scoring_result.get("key_strengths", []) + scoring_result.get("improvement_areas", [])
+        ai_recommendations, outreach_results = await asyncio.gather(
+            ai_recommendation_service.generate_sales_recommendations(
                 company_name=company.name,
                 ai_readiness_score=scoring_result["overall_score"],
-                key_insights=scoring_result.get("key_strengths", []) + scoring_result.get("improvement_areas", [])
-            )
+                component_scores=scoring_result["component_scores"],
+                company_data=company_analysis_data,
+                decision_makers=decision_makers,
+                is_financial=is_financial,
+                deterministic=True
+            ),
+            ai_recommendation_service.generate_personalized_outreach_batch(
+                decision_makers=top_decision_makers,
+                company_name=company.name,
+                ai_readiness_score=scoring_result["overall_score"],
+                key_insights=key_insights,
+                deterministic=True
+            ),
+            return_exceptions=True
+        )
+        ai_recommendations = _log_source_failure("AI recommendations", ai_recommendations)
+        outreach_results = _log_source_failure("personalized outreach", outreach_results) or []
+        for dm, outreach in zip(top_decision_makers, outreach_results):
             dm["personalized_outreach"] = outreach
-            personalized_outreach.append(outreach)
         
         # Combine AI recommendations with existing outreach strategy
         outreach_strategy = decision_maker_service.generate_outreach_strategy(
@@ -547,6 +822,13 @@ async def analyze_comprehensive(request: Request, company: CompanyRequest):
                 formatted_dm["linkedin"] = dm["linkedin"]
             formatted_decision_makers.append(formatted_dm)
         
+        # Empty dicts stand in for missing sources so the fields below are plain lookups
+        ai = ai_recommendations or {}
+        web = web_data or {}
+        jobs = job_data or {}
+        news = news_data or {}
+        linkedin = linkedin_company or {}
+        
         response_data = {
             "company_name": company_name,
             "domain": company.domain,
@@ -560,19 +842,19 @@ async def analyze_comprehensive(request: Request, company: CompanyRequest):
                 "decision_makers": formatted_decision_makers,
                 "sales_approach": outreach_strategy,
                 "ai_powered_strategy": ai_recommendations if ai_recommendations else None,
-                "priority_level": ai_recommendations.get("priority_level", "medium") if ai_recommendations else "medium",
-                "estimated_deal_size": ai_recommendations.get("estimated_deal_size", "$500K-$1M") if ai_recommendations else "$500K-$1M",
-                "key_talking_points": ai_recommendations.get("key_talking_points", []) if ai_recommendations else outreach_strategy.get("messaging", "").split("\n"),
-                "recommended_use_cases": ai_recommendations.get("recommended_use_cases", []) if ai_recommendations else [],
-                "objection_handling": ai_recommendations.get("objection_handling", []) if ai_recommendations else [],
-                "next_steps": ai_recommendations.get("next_steps", []) if ai_recommendations else [
+                "priority_level": ai.get("priority_level", "medium"),
+                "estimated_deal_size": ai.get("estimated_deal_size", "$500K-$1M"),
+                "key_talking_points": ai.get("key_talking_points", []) if ai else outreach_strategy.get("messaging", "").split("\n"),
+                "recommended_use_cases": ai.get("recommended_use_cases", []),
+                "objection_handling": ai.get("objection_handling", []),
+                "next_steps": ai.get("next_steps", []) if ai else [
                     f"Target {len(formatted_decision_makers)} identified decision makers",
                     f"Use {outreach_strategy.get('approach', 'standard')} approach",
                     f"Timeline: {outreach_strategy.get('timeline', '2-4 weeks')}",
                     "Prepare customized demo focusing on identified use cases"
                 ],
-                "competitive_positioning": ai_recommendations.get("competitive_positioning", "") if ai_recommendations else "",
-                "success_metrics": ai_recommendations.get("success_metrics", []) if ai_recommendations else []
+                "competitive_positioning": ai.get("competitive_positioning", ""),
+                "success_metrics": ai.get("success_metrics", [])
             },
             "is_financial_company": is_financial,
             "data_sources": {
@@ -587,32 +869,32 @@ async def analyze_comprehensive(request: Request, company: CompanyRequest):
             "company_data": {
                 "basic_info": hunter_data or clearbit_data or {},
                 "linkedin_profile": {
-                    "company_size": linkedin_company.get("size") if linkedin_company else None,
-                    "employee_count": linkedin_company.get("employee_count") if linkedin_company else None,
-                    "follower_count": linkedin_company.get("follower_count") if linkedin_company else None,
-                    "specialties": linkedin_company.get("specialties", []) if linkedin_company else [],
-                    "recent_updates": linkedin_company.get("recent_updates", [])[:3] if linkedin_company else [],
-                    "founded": linkedin_company.get("founded") if linkedin_company else None
-                } if linkedin_company else {},
+                    "company_size": linkedin.get("size"),
+                    "employee_count": linkedin.get("employee_count"),
+                    "follower_count": linkedin.get("follower_count"),
+                    "specialties": linkedin.get("specialties", []),
+                    "recent_updates": linkedin.get("recent_updates", [])[:3],
+                    "founded": linkedin.get("founded")
+                } if linkedin else {},
                 "tech_signals": {
-                    "ai_mentions": web_data.get("ai_mentions_count", 0) if web_data else 0,
-                    "tech_stack": web_data.get("tech_stack_detected", []) if web_data else [],
-                    "ai_roles_hiring": web_data.get("careers_signals", {}).get("ai_roles", []) if web_data else []
+                    "ai_mentions": web.get("ai_mentions_count", 0),
+                    "tech_stack": web.get("tech_stack_detected", []),
+                    "ai_roles_hiring": web.get("careers_signals", {}).get("ai_roles", [])
                 },
                 "job_postings": {
-                    "total_jobs": job_data.get("total_jobs_found", 0) if job_data else 0,
-                    "ai_ml_jobs": job_data.get("ai_ml_jobs_count", 0) if job_data else 0,
-                    "tech_jobs": job_data.get("tech_jobs_count", 0) if job_data else 0,
-                    "ai_hiring_intensity": job_data.get("ai_hiring_intensity", "none") if job_data else "none",
-                    "top_ai_technologies": job_data.get("top_ai_technologies", [])[:5] if job_data else [],
-                    "recent_titles": job_data.get("recent_job_titles", [])[:5] if job_data else []
+                    "total_jobs": jobs.get("total_jobs_found", 0),
+                    "ai_ml_jobs": jobs.get("ai_ml_jobs_count", 0),
+                    "tech_jobs": jobs.get("tech_jobs_count", 0),
+                    "ai_hiring_intensity": jobs.get("ai_hiring_intensity", "none"),
+                    "top_ai_technologies": jobs.get("top_ai_technologies", [])[:5],
+                    "recent_titles": jobs.get("recent_job_titles", [])[:5]
                 },
                 "news_insights": {
-                    "total_articles": news_data.get("total_articles_found", 0) if news_data else 0,
-                    "articles_analyzed": news_data.get("articles_processed", 0) if news_data else 0,
-                    "tech_focus_score": news_data.get("tech_focus_score", 0) if news_data else 0,
-                    "recent_trends": news_data.get("recent_trends", []) if news_data else [],
-                    "top_articles": news_data.get("articles", [])[:3] if news_data else []
+                    "total_articles": news.get("total_articles_found", 0),
+                    "articles_analyzed": news.get("articles_processed", 0),
+                    "tech_focus_score": news.get("tech_focus_score", 0),
+                    "recent_trends": news.get("recent_trends", []),
+                    "top_articles": news.get("articles", [])[:3]
                 }
             }
         }
@@ -625,7 +907,7 @@ async def analyze_comprehensive(request: Request, company: CompanyRequest):
         return response_data
         
     except Exception as e:
-        logging.error(f"Error in comprehensive analysis: {e}")
+        logger.exception("Error in comprehensive analysis")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @app.post("/generate-report")
@@ -636,39 +918,45 @@ async def generate_pdf_report(request: Request, analysis_data: Dict[str, Any]):
     """
     try:
         # Log the incoming data for debugging
-        logging.info(f"Generating report for company: {analysis_data.get('company_name', 'Unknown')}")
-        logging.debug(f"Analysis data keys: {list(analysis_data.keys())}")
+        logger.info("Generating report for company: %s", analysis_data.get('company_name', 'Unknown'))
+        logger.debug("Analysis data keys: %s", list(analysis_data.keys()))
         
         # Extract company info from the analysis data
         company_name = analysis_data.get("company_name", "Unknown Company")
         domain = analysis_data.get("domain")
         
         # Log before generation
-        logging.info(f"Using reports directory: {reports_dir}")
+        logger.info("Using reports directory: %s", reports_dir)
         
-        # Generate PDF report with enhanced design
-        report_path = enhanced_pdf_generator.generate_report(
+        # Generate PDF report with enhanced design (ReportLab is synchronous,
+        # run it in a worker thread so the event loop keeps serving requests)
+        report_path = await asyncio.to_thread(
+            get_pdf_generator().generate_report,
             company_name=company_name,
             ai_readiness_data=analysis_data
         )
         
         # Return file for download
-        from fastapi.responses import FileResponse
-        import os
-        
-        if os.path.exists(report_path):
-            logging.info(f"Report generated successfully: {report_path}")
-            return FileResponse(
-                path=report_path,
-                media_type='application/pdf',
-                filename=os.path.basename(report_path)
-            )
-        else:
-            logging.error(f"Report file not found: {report_path}")
+        try:
+            report_stat = await asyncio.to_thread(os.stat, report_path)
+        except FileNotFoundError:
+            logger.error("Report file not found: %s", report_path)
             raise HTTPException(status_code=500, detail="Report generation failed - file not found")
+        
+        logger.info("Report generated successfully: %s", report_path)
+        # Reports are timestamped and generated per request, delete each one
+        # once it has been sent so the reports directory doesn't grow forever
+        return FileResponse(
+            path=report_path,
+            media_type='application/pdf',
+            filename=os.path.basename(report_path),
+            stat_result=report_stat,
+            headers={"Cache-Control": "private, max-age=3600"},
+            background=BackgroundTask(os.remove, report_path)
+        )
             
     except Exception as e:
-        logging.error(f"Error generating PDF report: {e}", exc_info=True)
+        logger.error("Error generating PDF report: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
 @app.get("/reports/{filename}")
@@ -676,12 +964,13 @@ async def download_report(filename: str):
     """
     Download a previously generated report
     """
-    from fastapi.responses import FileResponse
-    import os
+    # Only serve files directly inside the reports directory
+    if filename != os.path.basename(filename) or filename in ("", ".", ".."):
+        raise HTTPException(status_code=400, detail="Invalid report name")
     
     report_path = f"reports/{filename}"
     
-    if os.path.exists(report_path):
+    if os.path.isfile(report_path):
         return FileResponse(
             path=report_path,
             media_type='application/pdf',
@@ -690,6 +979,30 @@ async def download_report(filename: str):
     else:
         raise HTTPException(status_code=404, detail="Report not found")
 
+# Autocomplete queries repeat heavily and the company database is static, so
+# formatted results are kept for the lifetime of the worker
+SUGGESTIONS_CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
+EMPTY_SUGGESTIONS_BYTES = orjson.dumps({"suggestions": []})
+
+@functools.lru_cache(maxsize=4096)
+def _company_suggestions_json(query: str) -> bytes:
+    """Search the company database and serialize the formatted suggestions"""
+    logger.info("Searching for companies with query: %s", query)
+    suggestions = company_database.search_companies(query, limit=8)
+    logger.info("Found %s suggestions for query: %s", len(suggestions), query)
+    
+    # Format response for frontend
+    formatted_suggestions = []
+    for company in suggestions:
+        formatted_suggestions.append({
+            "name": company["name"],
+            "ticker": company.get("ticker", ""),
+            "type": company.get("type", "Company"),
+            "sector": company.get("sector", ""),
+        })
+    
+    return orjson.dumps({"suggestions": formatted_suggestions})
+
 @app.get("/api/company-suggestions")
 async def get_company_suggestions(q: str = None):
     """
@@ -701,30 +1014,17 @@ async def get_company_suggestions(q: str = None):
     Returns:
         List of matching companies with details
     """
-    if not q or len(q) < 2:
-        return {"suggestions": []}
+    q = q.strip().lower() if q else ""
+    if len(q) < 2:
+        return Response(content=EMPTY_SUGGESTIONS_BYTES, media_type="application/json")
     
     try:
-        # Search for matching companies
-        logging.info(f"Searching for companies with query: {q}")
-        suggestions = company_database.search_companies(q, limit=8)
-        logging.info(f"Found {len(suggestions)} suggestions for query: {q}")
-        
-        # Format response for frontend
-        formatted_suggestions = []
-        for company in suggestions:
-            formatted_suggestions.append({
-                "name": company["name"],
-                "ticker": company.get("ticker", ""),
-                "type": company.get("type", "Company"),
-                "sector": company.get("sector", ""),
-            })
-        
-        return {"suggestions": formatted_suggestions}
-    
+        content = _company_suggestions_json(q)
     except Exception as e:
-        logging.error(f"Error fetching company suggestions: {e}")
-        return {"suggestions": []}
+        logger.error("Error fetching company suggestions: %s", e)
+        content = EMPTY_SUGGESTIONS_BYTES
+    
+    return Response(content=content, media_type="application/json", headers=SUGGESTIONS_CACHE_HEADERS)
 
 @app.get("/api/validate-company")
 async def validate_company(name: str = None):
@@ -742,7 +1042,7 @@ async def validate_company(name: str = None):
     
     try:
         # Search for exact match or close matches
-        logging.info(f"Validating company name: {name}")
+        logger.info("Validating company name: %s", name)
         matches = company_database.search_companies(name, limit=5)
         
         # Check for exact match (case-insensitive)
@@ -755,13 +1055,13 @@ async def validate_company(name: str = None):
                 break
         
         if exact_match:
-            logging.info(f"Company '{name}' is valid")
+            logger.info("Company '%s' is valid", name)
             return {
                 "valid": True,
                 "message": "Company found in database"
             }
         else:
-            logging.info(f"Company '{name}' not found, suggesting alternatives")
+            logger.info("Company '%s' not found, suggesting alternatives", name)
             # Return suggestions for similar companies
             suggestions = [c["name"] for c in matches[:3]]
             return {
@@ -771,16 +1071,73 @@ async def validate_company(name: str = None):
             }
     
     except Exception as e:
-        logging.error(f"Error validating company: {e}")
+        logger.error("Error validating company: %s", e)
         return {"valid": False, "message": "Error validating company"}
 
+# Longest a client stays subscribed to one analysis, so an id that is never
+# used (or whose analysis died on another worker) does not hold a subscription
+PROGRESS_SUBSCRIPTION_TIMEOUT_SECONDS = 600.0
+PROGRESS_TERMINAL_STAGES = frozenset({"complete", "error"})
+
+async def _relay_progress(websocket: WebSocket, updates: AsyncIterator[Dict[str, Any]]):
+    """
+    Forward progress updates to the client until the analysis ends
+    The next update is raced against the client's own messages, so a
+    disconnect or the subscription deadline ends the relay right away
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + PROGRESS_SUBSCRIPTION_TIMEOUT_SECONDS
+    next_update = asyncio.ensure_future(updates.__anext__())
+    next_message = asyncio.ensure_future(websocket.receive())
+    try:
+        while True:
+            done, _ = await asyncio.wait(
+                {next_update, next_message},
+                timeout=deadline - loop.time(),
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                logger.info("Progress subscription timed out")
+                return
+            if next_message in done:
+                if next_message.result()["type"] == "websocket.disconnect":
+                    return
+                # Client messages are ignored, keep listening for a disconnect
+                next_message = asyncio.ensure_future(websocket.receive())
+            if next_update in done:
+                try:
+                    update = next_update.result()
+                except StopAsyncIteration:
+                    return
+                await websocket.send_json(update)
+                if update["type"] in PROGRESS_TERMINAL_STAGES:
+                    return
+                next_update = asyncio.ensure_future(updates.__anext__())
+    finally:
+        for task in (next_update, next_message):
+            task.cancel()
+        await asyncio.gather(next_update, next_message, return_exceptions=True)
+
 @app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, progress_id: Optional[str] = None):
     """
     WebSocket endpoint for real-time progress updates
+    Connect with the progress_id later passed to /analyze/comprehensive to
+    receive that analysis's stage updates until it completes
     """
     await websocket.accept()
     try:
+        if progress_id:
+            async with progress_broker.subscribe(progress_id) as updates:
+                # Subscribed before confirming, so no update can be missed
+                await websocket.send_json({
+                    "type": "connection",
+                    "message": "Connected to progress updates",
+                    "progress": 0
+                })
+                await _relay_progress(websocket, updates)
+            return
+        
         # Send initial connection confirmation
         await websocket.send_json({
             "type": "connection",
@@ -788,30 +1145,39 @@ async def websocket_endpoint(websocket: WebSocket):
             "progress": 0
         })
         
-        # In a real implementation, you would send actual progress updates
-        # during the analysis process. For now, we'll just keep the connection open
-        while True:
-            # Wait for any message from client (heartbeat)
-            data = await websocket.receive_text()
-            
-            # Echo back a heartbeat
-            await websocket.send_json({
-                "type": "heartbeat",
-                "message": "Connection active"
-            })
+        # Nothing to relay, hold the connection until the client leaves.
+        # Liveness is checked with protocol pings (ws_ping_interval), so
+        # client messages are ignored rather than answered
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
             
+    except WebSocketDisconnect:
+        pass
     except Exception as e:
-        logging.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
     finally:
-        await websocket.close()
+        if websocket.client_state == WebSocketState.CONNECTED:
+            await websocket.close()
 
 if __name__ == "__main__":
-    # Run with uvicorn when executed directly
+    # Development runs a single auto-reloading process. With
+    # ENVIRONMENT=production reload is off and uvicorn forks WEB_CONCURRENCY
+    # workers (one per CPU by default), gunicorn_conf.py is the managed alternative
     port = int(os.getenv("PORT", 8000))
+    is_production = os.getenv("ENVIRONMENT") == "production"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True,  # Enable auto-reload during development
-        log_level="info"
+        loop="uvloop" if sys.platform != "win32" else "asyncio",  # uvloop has no Windows support
+        http="httptools",
+        limit_concurrency=200,  # Respond 503 beyond this instead of degrading everyone
+        backlog=2048,
+        timeout_keep_alive=5,
+        ws_ping_interval=20.0,  # Detect dead WebSocket peers with protocol-level pings
+        ws_ping_timeout=20.0,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)) if is_production else 1,
+        reload=not is_production,  # Enable auto-reload during development
+        log_level="warning" if is_production else "info",
+        access_log=not is_production  # A synchronous log line per request, development only
     )
\ No newline at end of file
@@ -2,8 +2,9 @@
 SQLAlchemy models for Prospect Intelligence Tool
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, Enum, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, SmallInteger, Float, DateTime, Text, ForeignKey, Enum, JSON, Uuid, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -12,6 +13,9 @@ try:
 except ImportError:
     from .database import Base
 
+# Binary JSONB on Postgres (no re-parse on read, GIN-indexable), JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class CompanySizeCategory(enum.Enum):
     """Enum for company size categories"""
@@ -35,8 +39,8 @@ class Company(Base):
     """
     __tablename__ = "companies"
 
-    # Primary key using UUID
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Primary key using UUID (native 16-byte UUID on Postgres, CHAR(32) elsewhere)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     
     # Company basic information
     name = Column(String(255), nullable=False, index=True)
@@ -67,12 +71,19 @@ class TechSignal(Base):
     Technology signals collected from various sources about a company
     """
     __tablename__ = "tech_signals"
+    __table_args__ = (
+        # Latest signals of a type for a company in one index range scan
+        # (also serves company_id-only lookups as its leading column)
+        Index("ix_tech_signals_company_type_date", "company_id", "signal_type", "date"),
+        # Containment queries on keywords (e.g. signals mentioning tensorflow)
+        Index("ix_tech_signals_keywords_gin", "tech_keywords", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     # Primary key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     
     # Foreign key to Company
-    company_id = Column(String(36), ForeignKey("companies.id"), nullable=False, index=True)
+    company_id = Column(Uuid, ForeignKey("companies.id"), nullable=False)
     
     # Signal information
     signal_type = Column(Enum(SignalType), nullable=False, index=True)
@@ -82,11 +93,11 @@ class TechSignal(Base):
     
     # Signal metadata
     date = Column(DateTime(timezone=True), nullable=False)
-    relevance_score = Column(Integer, nullable=False, default=50)  # 0-100
+    relevance_score = Column(SmallInteger, nullable=False, default=50)  # 0-100
     
     # AI/Tech specific indicators
     ai_mentioned = Column(Integer, default=0)  # Count of AI mentions
-    tech_keywords = Column(JSON, nullable=True)  # List of identified tech keywords
+    tech_keywords = Column(JSONType, nullable=True)  # List of identified tech keywords
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -103,15 +114,24 @@ class AIReadinessScore(Base):
     AI readiness scores and assessment for companies
     """
     __tablename__ = "ai_readiness_scores"
+    __table_args__ = (
+        # Latest score for a company without a sort
+        Index("ix_ai_readiness_scores_company_generated", "company_id", "generated_at"),
+        Index("ix_ai_readiness_scores_sources_gin", "data_sources_used", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     # Primary key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     
     # Foreign key to Company
-    company_id = Column(String(36), ForeignKey("companies.id"), nullable=False, index=True)
+    company_id = Column(Uuid, ForeignKey("companies.id"), nullable=False)
     
     # Overall score and components
-    overall_score = Column(Integer, nullable=False)  # 0-100
+    overall_score = Column(SmallInteger, nullable=False)  # 0-100
+    
+    # Derived from overall_score when it is set, stored so prospects can be
+    # filtered by category in SQL
+    readiness_category = Column(String(20), nullable=False, index=True)
     confidence = Column(Float, nullable=False, default=0.5)  # 0.0-1.0
     
     # Component scores stored as JSON
@@ -122,15 +142,15 @@ class AIReadinessScore(Base):
     #   "industry_adoption": 75,
     #   "modernization_signals": 80
     # }
-    component_scores = Column(JSON, nullable=False)
+    component_scores = Column(JSONType, nullable=False)
     
     # Analysis details
     analysis_summary = Column(Text, nullable=True)
-    recommendations = Column(JSON, nullable=True)  # List of recommended actions
-    decision_makers = Column(JSON, nullable=True)  # List of identified decision makers
+    recommendations = Column(JSONType, nullable=True)  # List of recommended actions
+    decision_makers = Column(JSONType, nullable=True)  # List of identified decision makers
     
     # Metadata
-    data_sources_used = Column(JSON, nullable=True)  # List of data sources
+    data_sources_used = Column(JSONType, nullable=True)  # List of data sources
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
     valid_until = Column(DateTime(timezone=True), nullable=True)
     
@@ -145,14 +165,20 @@ class AIReadinessScore(Base):
         """Check if company is high potential prospect (score >= 70)"""
         return self.overall_score >= 70
     
-    @property
-    def readiness_category(self):
-        """Categorize readiness level"""
-        if self.overall_score >= 80:
-            return "Very Ready"
-        elif self.overall_score >= 60:
-            return "Ready"
-        elif self.overall_score >= 40:
-            return "Somewhat Ready"
-        else:
-            return "Not Ready"
\ No newline at end of file
+    @validates("overall_score")
+    def _set_readiness_category(self, key, overall_score):
+        """Keep readiness_category in step with overall_score"""
+        self.readiness_category = categorize_readiness(overall_score)
+        return overall_score
+
+
+def categorize_readiness(overall_score: int) -> str:
+    """Categorize readiness level"""
+    if overall_score >= 80:
+        return "Very Ready"
+    elif overall_score >= 60:
+        return "Ready"
+    elif overall_score >= 40:
+        return "Somewhat Ready"
+    else:
+        return "Not Ready"
@@ -0,0 +1,92 @@
+"""
+Progress updates for long-running analyses, relayed to WebSocket clients
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+async def _iter_queue(queue: asyncio.Queue) -> AsyncIterator[Dict[str, Any]]:
+    """Yield messages put on an in-process subscriber queue"""
+    while True:
+        yield await queue.get()
+
+
+class ProgressBroker:
+    """
+    Publishes analysis progress to per-analysis channels
+    With a Redis client messages go through Redis pub/sub, so a WebSocket held
+    by one worker receives the updates of an analysis running on another.
+    Without one, subscribers are fed from in-process queues.
+    """
+
+    def __init__(self, redis: Optional[Any] = None, prefix: str = "progress"):
+        """
+        Initialize the broker
+
+        Args:
+            redis: Optional redis.asyncio client shared by every worker
+            prefix: Prefix for the Redis channel names
+        """
+        self.redis = redis
+        self.prefix = prefix
+
+        # In-process subscribers (progress id -> queues of connected clients)
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def _channel(self, progress_id: str) -> str:
+        """Build the Redis channel name for a progress id"""
+        return f"{self.prefix}:{progress_id}"
+
+    async def publish(self, progress_id: str, message: Dict[str, Any]):
+        """Send a message to every subscriber of progress_id, dropping it if there are none"""
+        if self.redis is None:
+            for queue in self._subscribers.get(progress_id, ()):
+                queue.put_nowait(message)
+            return
+
+        try:
+            await self.redis.publish(self._channel(progress_id), orjson.dumps(message))
+        except Exception as e:
+            # Progress is best effort, never fail the analysis over it
+            logger.warning("Progress publish failed for %s: %s", progress_id, e)
+
+    @asynccontextmanager
+    async def subscribe(self, progress_id: str):
+        """
+        Subscribe to progress_id for the duration of the context
+
+        The subscription is active once the context is entered, so messages
+        published after that are not missed.
+
+        Yields:
+            Async iterator over the published messages
+        """
+        if self.redis is None:
+            queue = asyncio.Queue()
+            self._subscribers.setdefault(progress_id, set()).add(queue)
+            try:
+                yield _iter_queue(queue)
+            finally:
+                subscribers = self._subscribers[progress_id]
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[progress_id]
+            return
+
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(self._channel(progress_id))
+        try:
+            yield (
+                orjson.loads(message["data"])
+                async for message in pubsub.listen()
+                if message["type"] == "message"
+            )
+        finally:
+            await pubsub.aclose()
@@ -4,34 +4,521 @@ Generates personalized sales recommendations based on company analysis
 """
 
 import os
+import asyncio
+import hashlib
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
+import random
+import re
+import time
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple, Callable, Awaitable, Set
 import httpx
 import json
+import orjson
 from dotenv import load_dotenv
 from pathlib import Path
 
+from .coalesce import SingleFlight
+from .http import HTTPClientMixin
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
 logger = logging.getLogger(__name__)
 
+# Transient OpenAI failures are retried with jittered exponential backoff,
+# capped so a struggling API can't stall an analysis for long
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 3
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 8.0
+
+# Batch API jobs finish within 24 hours, there's no point polling often
+BATCH_POLL_SECONDS = 60
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Larger JSON documents are parsed on a worker thread so a burst of
+# responses doesn't stall the event loop
+OFFLOAD_PARSE_BYTES = 64 * 1024
+
+# Semantic cache lookups embed the prompt context, a fraction of a cent per call
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Concurrent embedding requests are sent together, see EmbeddingBatcher
+EMBEDDING_BATCH_SIZE = 32
+EMBEDDING_BATCH_WAIT_SECONDS = 0.002
+
+# Sections of the per-company prompt context, see _prepare_context
+_CONTEXT_HEADER_TEMPLATE = """
+Company Analysis for {company_name}:
+
+AI Readiness Score: {score}/100
+Industry: {industry}
+
+Component Scores:"""
+
+_HIRING_SIGNALS_TEMPLATE = """
+Hiring Signals:
+- Total tech jobs: {total_jobs}
+- AI/ML roles: {ai_ml_jobs}
+- AI hiring intensity: {intensity}"""
+
+_TECH_INDICATORS_TEMPLATE = """
+Technology Indicators:
+- AI mentions on website: {ai_mentions}
+- Tech stack detected: {tech_stack}"""
+
+_NEWS_TEMPLATE = """
+Recent News & Trends:
+- Articles analyzed: {articles}
+- Tech focus score: {tech_focus}/100
+- Recent trends: {trends}"""
+
+_DECISION_MAKERS_TEMPLATE = """
+Key Decision Makers Identified: {count}
+Top roles: {roles}"""
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
+
+
+async def _parse_json(content) -> Any:
+    """orjson.loads, moved off the event loop for large documents"""
+    if len(content) > OFFLOAD_PARSE_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
+
+
+def _parse_batch_output(text: str) -> Dict[str, Dict[str, Any]]:
+    """Successful recommendations in a Batch API output file, keyed by custom_id"""
+    results = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        # One bad line only sends its own company to the template fallback
+        try:
+            record = orjson.loads(line)
+            response_data = record.get("response") or {}
+            if response_data.get("status_code") != 200:
+                continue
+            content = response_data["body"]["choices"][0]["message"]["content"]
+            results[record["custom_id"]] = orjson.loads(content)
+        except (orjson.JSONDecodeError, AttributeError, KeyError, IndexError, TypeError) as e:
+            logger.error("Failed to parse Batch API output line: %s", e)
+    return results
+
+
+def _rename_company(value: Any, old_name: str, new_name: str) -> Any:
+    """Copy of reused recommendations with one company's name swapped for another's"""
+    # Whole words only, so "Meta" leaves "Metadata" alone. Lookarounds
+    # rather than \b, which never matches after names like "Yahoo!"
+    pattern = re.compile(rf"(?<!\w){re.escape(old_name)}(?!\w)")
+    return _replace_name(value, pattern, new_name)
+
+
+def _replace_name(value: Any, pattern: re.Pattern, new_name: str) -> Any:
+    """Replace every match of pattern in the strings nested in value"""
+    if isinstance(value, str):
+        return pattern.sub(lambda _: new_name, value)
+    if isinstance(value, list):
+        return [_replace_name(item, pattern, new_name) for item in value]
+    if isinstance(value, dict):
+        return {key: _replace_name(item, pattern, new_name) for key, item in value.items()}
+    return value
+
+
+# Fallback recommendations used without OpenAI, built once at import
+# Readiness bands: (minimum score, priority, timeline, deal size, strategy)
+_TEMPLATE_BANDS = (
+    (70, "high", "Immediate", "$1M-$3M",
+     "{company_name} shows strong AI readiness. Position ModelML as the platform to scale their existing AI initiatives enterprise-wide."),
+    (40, "medium", "3-6 months", "$500K-$1M",
+     "{company_name} is building AI capabilities. ModelML can accelerate their journey with pre-built models and infrastructure."),
+    (0, "low", "6-12 months", "$250K-$500K",
+     "{company_name} is early in AI adoption. Focus on education and quick wins with ModelML's turnkey solutions."),
+)
+_FINANCIAL_TALKING_POINTS = (
+    "Regulatory-compliant AI models designed for financial services",
+    "Pre-built fraud detection and risk assessment models available",
+    "SOC 2 Type II certification with bank-grade security standards",
+)
+_FINANCIAL_USE_CASES = (
+    "Real-time fraud detection and prevention",
+    "Credit risk assessment and underwriting",
+    "Regulatory compliance automation",
+)
+_GENERAL_TALKING_POINTS = (
+    "AI deployment timeline reduced from months to weeks",
+    "Seamless scaling from prototype to production environment",
+    "Enterprise-grade security and governance built-in",
+)
+_GENERAL_USE_CASES = (
+    "Customer service automation",
+    "Predictive analytics for operations",
+    "Document processing and extraction",
+)
+_TEMPLATE_OBJECTIONS = (
+    {
+        "objection": "We don't have AI expertise",
+        "response": "ModelML provides pre-built models and full support, no ML expertise required"
+    },
+    {
+        "objection": "Concerned about cost",
+        "response": "ModelML typically delivers ROI within 6 months through efficiency gains"
+    },
+)
+_TEMPLATE_NEXT_STEPS = (
+    "Prepare customized demo focusing on their use cases",
+    "Share relevant case studies from their industry",
+)
+_TEMPLATE_COMPETITIVE_POSITIONING = "Unlike generic platforms, ModelML provides industry-specific models and compliance features"
+_TEMPLATE_SUCCESS_METRICS = (
+    "Time to deploy first AI model",
+    "Cost savings from automation",
+    "Improvement in decision accuracy",
+)
+_TEMPLATE_OUTREACH_TALKING_POINTS = (
+    "Quick wins we can deliver in the first 30 days",
+    "ROI and success metrics from similar implementations",
+)
+
+
+def _skip_whitespace(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+        pos += 1
+    return pos
+
 
-class AIRecommendationService:
+def _parse_completed_fields(buffer: str, pos: int) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse the top-level fields of a partially streamed JSON object that are complete
+    
+    Returns:
+        The newly completed fields and the position to resume parsing from
+    """
+    fields = {}
+    while True:
+        while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE + "{,":
+            pos += 1
+        try:
+            key, end = _JSON_DECODER.raw_decode(buffer, pos)
+            end = _skip_whitespace(buffer, end)
+            if buffer[end:end + 1] != ":":
+                return fields, pos
+            value, end = _JSON_DECODER.raw_decode(buffer, _skip_whitespace(buffer, end + 1))
+        except json.JSONDecodeError:
+            return fields, pos
+        # A value is only final once the next separator arrives, "12" may still become "123"
+        end = _skip_whitespace(buffer, end)
+        if buffer[end:end + 1] not in (",", "}"):
+            return fields, pos
+        fields[key] = value
+        pos = end
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched API calls
+    The first request opens a short window, everything queued within it (up
+    to max_batch_size) is embedded in one round trip
+    """
+    
+    def __init__(
+        self,
+        embed_many: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_wait_seconds: float = EMBEDDING_BATCH_WAIT_SECONDS
+    ):
+        self.embed_many = embed_many
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()  # Keeps in-flight batches referenced
+    
+    async def embed(self, text: str) -> List[float]:
+        """Embedding of text, computed together with any concurrent requests"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+    
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            embeddings = await self.embed_many([text for text, _ in batch])
+            if len(embeddings) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(embeddings)}")
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            # Every caller still waiting gets the error, none is left hanging
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+class AIRecommendationService(HTTPClientMixin):
     """
     Service for generating AI-powered sales recommendations using OpenAI
     """
     
-    def __init__(self):
+    BASE_URL = "https://api.openai.com/v1"
+    
+    # OpenAI serves HTTP/2, multiplexing concurrent calls on one connection
+    FALLBACK_CLIENT_OPTIONS = {"http2": True}
+    
+    # Static instructions lead the prompt so OpenAI's automatic prompt caching
+    # can reuse them across prospects, only the tail differs per company
+    _STATIC_SALES_PROMPT_PREFIX = """
+You are a sales strategist for ModelML, an AI infrastructure platform that helps enterprises deploy and scale AI models.
+
+Generate specific, actionable sales recommendations for the company analysis at the end of this message.
+
+Generate a JSON response with the following structure:
+{
+    "sales_strategy": "High-level approach (2-3 sentences)",
+    "priority_level": "high/medium/low",
+    "estimated_deal_size": "Range like $500K-$1M",
+    "timeline": "Immediate/3-6 months/6-12 months",
+    "key_talking_points": [
+        "Specific value prop 1",
+        "Specific value prop 2",
+        "Specific value prop 3"
+    ],
+    "recommended_use_cases": [
+        "Use case 1 based on their industry/needs",
+        "Use case 2",
+        "Use case 3"
+    ],
+    "objection_handling": [
+        {"objection": "Likely concern 1", "response": "How to address it"},
+        {"objection": "Likely concern 2", "response": "How to address it"}
+    ],
+    "next_steps": [
+        "Immediate action 1",
+        "Follow-up action 2",
+        "Long-term action 3"
+    ],
+    "competitive_positioning": "How ModelML compares to alternatives they might consider",
+    "success_metrics": [
+        "KPI they care about 1",
+        "KPI they care about 2"
+    ]
+}
+
+IMPORTANT RULES for key_talking_points:
+- Do NOT start with "You're", "Your", "You have", "You are", etc.
+- Start with factual statements or direct benefits
+- Example: Instead of "You're hiring aggressively", write "Aggressive AI talent hiring (42 open positions)"
+- Example: Instead of "Your recent initiative", write "Recent Goldman Sachs AI-Powered Trading Platform aligns with ModelML"
+- Make them crisp, factual, and professional
+
+Make the recommendations specific to their AI readiness level and industry. Be concrete and actionable.
+
+Company analysis:
+"""
+    
+    _STATIC_OUTREACH_PROMPT_PREFIX = """
+Generate a personalized outreach strategy for the decision maker at the end of this message.
+
+Create a JSON response with:
+{
+    "email_subject_lines": [3 compelling subject lines],
+    "opening_line": "Personalized opening that references their role/company",
+    "value_proposition": "2-3 sentences on ModelML's specific value for them",
+    "social_proof": "Relevant customer success story or metric",
+    "call_to_action": "Specific next step",
+    "linkedin_message": "Short LinkedIn outreach message (under 300 chars)",
+    "talking_points": [3 specific points for a call]
+}
+
+IMPORTANT: For talking_points, do NOT start with "You", "Your", etc. Use factual, professional language.
+
+Decision maker:
+"""
+    
+    _STATIC_OUTREACH_BATCH_PROMPT_PREFIX = """
+Generate a personalized outreach strategy for each numbered decision maker at the end of this message.
+
+Create a JSON response with one entry per decision maker:
+{
+    "outreach": [
+        {
+            "id": <the decision maker's number>,
+            "email_subject_lines": [3 compelling subject lines],
+            "opening_line": "Personalized opening that references their role/company",
+            "value_proposition": "2-3 sentences on ModelML's specific value for them",
+            "social_proof": "Relevant customer success story or metric",
+            "call_to_action": "Specific next step",
+            "linkedin_message": "Short LinkedIn outreach message (under 300 chars)",
+            "talking_points": [3 specific points for a call]
+        }
+    ]
+}
+
+IMPORTANT: For talking_points, do NOT start with "You", "Your", etc. Use factual, professional language.
+
+"""
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, cache: Optional[Any] = None):
         """Initialize OpenAI service"""
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        self.base_url = "https://api.openai.com/v1"
-        self.model = "gpt-4-turbo-preview"  # Or gpt-3.5-turbo for faster/cheaper
+        # Several comma-separated keys (e.g. separate projects or Azure deployments)
+        # are used in turn, a key that hits a 429 is skipped until it cools down
+        self.api_keys = [
+            key.strip() for key in os.getenv("OPENAI_API_KEYS", os.getenv("OPENAI_API_KEY", "")).split(",")
+            if key.strip()
+        ]
+        self.api_key = self.api_keys[0] if self.api_keys else None
+        self._key_cycle = itertools.cycle(self.api_keys)
+        self._key_cooldowns: Dict[str, float] = {}
+        self._inflight = SingleFlight()  # Uncached requests in progress, by prompt hash
+        self.client = client  # Shared HTTP client, a client per call if None
+        self.cache = cache  # Optional TTLCache for deterministic completions, keyed by prompt hash
+        self.semantic_cache = None  # Optional SemanticCache reusing recommendations for near-identical contexts
+        self._embedding_batcher = EmbeddingBatcher(self._embed_many)
+        # A mini model is plenty for schema-shaped JSON, callers can ask for a larger one per call
+        self.model = os.getenv("OPENAI_RECOMMENDATION_MODEL", "gpt-4o-mini")
         
         if not self.api_key:
             logger.warning("OpenAI API key not found. Will use template-based recommendations.")
     
+    async def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embeddings of several texts in one API call, in input order"""
+        async with self._http_client() as client:
+            response = await client.post(
+                f"{self.BASE_URL}/embeddings",
+                headers={
+                    "Authorization": f"Bearer {self._next_api_key()}",
+                    "Content-Type": "application/json"
+                },
+                content=orjson.dumps({"model": EMBEDDING_MODEL, "input": texts}),
+                timeout=10
+            )
+        response.raise_for_status()
+        data = sorted(orjson.loads(response.content)["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+    
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """Embedding of text for the semantic cache, None if the call failed"""
+        try:
+            return await self._embedding_batcher.embed(text)
+        except Exception as e:
+            logger.error("Error embedding prompt context: %s", e)
+            return None
+    
+    def _next_api_key(self) -> str:
+        """Next key in rotation, skipping keys still cooling down from a 429"""
+        now = time.monotonic()
+        for _ in range(len(self.api_keys)):
+            key = next(self._key_cycle)
+            if self._key_cooldowns.get(key, 0.0) <= now:
+                return key
+        # Every key is rate limited, take the one that frees up first
+        return min(self.api_keys, key=lambda key: self._key_cooldowns.get(key, 0.0))
+    
+    def _cool_down(self, key: str, seconds: float) -> float:
+        """Park a rate-limited key, returns how long until any key is usable again"""
+        now = time.monotonic()
+        self._key_cooldowns[key] = now + seconds
+        return max(0.0, min(self._key_cooldowns.get(key, 0.0) for key in self.api_keys) - now)
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt, honoring the server's Retry-After"""
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+            except ValueError:
+                pass  # HTTP-date form, fall back to backoff
+        backoff = min(INITIAL_BACKOFF_SECONDS * 2 ** attempt, MAX_BACKOFF_SECONDS)
+        return backoff / 2 + random.uniform(0, backoff / 2)
+    
+    @staticmethod
+    def _prompt_cache_key(payload: Dict[str, Any]) -> str:
+        """Hash everything in the request that determines the completion"""
+        key_fields = {field: payload[field] for field in ("model", "messages", "temperature", "max_tokens", "response_format")}
+        return hashlib.sha256(orjson.dumps(key_fields, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    async def _chat_completion(self, payload: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Request a JSON chat completion
+        Deterministic (temperature 0) requests are served from the cache when
+        one is configured, so re-analyzing a prospect doesn't pay for the same
+        completion twice
+        
+        Returns:
+            Parsed JSON content, None if the call or parsing failed
+        """
+        async def request() -> Optional[Dict[str, Any]]:
+            for attempt in range(MAX_ATTEMPTS):
+                last_attempt = attempt == MAX_ATTEMPTS - 1
+                api_key = self._next_api_key()
+                try:
+                    async with self._http_client() as client:
+                        response = await client.post(
+                            f"{self.BASE_URL}/chat/completions",
+                            headers={
+                                "Authorization": f"Bearer {api_key}",
+                                "Content-Type": "application/json"
+                            },
+                            content=orjson.dumps(payload),
+                            timeout=timeout
+                        )
+                except httpx.TransportError as e:
+                    if last_attempt:
+                        raise
+                    delay = self._retry_delay(attempt)
+                    logger.warning("OpenAI request failed (%s), retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                
+                if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                    break
+                delay = self._retry_delay(attempt, response.headers.get("retry-after"))
+                if response.status_code == 429:
+                    # Retry straight away when another key isn't rate limited
+                    delay = self._cool_down(api_key, delay)
+                logger.warning("OpenAI API returned %s, retrying in %.1fs", response.status_code, delay)
+                await asyncio.sleep(delay)
+            
+            if response.status_code != 200:
+                logger.error("OpenAI API error: %s - %s", response.status_code, response.text)
+                return None
+            
+            content = (await _parse_json(response.content))["choices"][0]["message"]["content"]
+            try:
+                return await _parse_json(content)
+            except orjson.JSONDecodeError:
+                logger.error("Failed to parse OpenAI JSON response")
+                return None
+        
+        if self.cache is not None and payload["temperature"] == 0:
+            # Failed calls return None, which the cache never stores
+            return await self.cache.get_or_compute(self._prompt_cache_key(payload), request)
+        
+        # Sampled completions aren't cached, but identical requests made while
+        # one is in flight (e.g. two dashboards refreshing a prospect) share it
+        return await self._inflight.run(self._prompt_cache_key(payload), request)
+    
     async def generate_sales_recommendations(
         self,
         company_name: str,
@@ -39,7 +526,9 @@ class AIRecommendationService:
         component_scores: Dict[str, int],
         company_data: Dict[str, Any],
         decision_makers: List[Dict[str, Any]],
-        is_financial: bool = False
+        is_financial: bool = False,
+        deterministic: bool = False,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate AI-powered sales recommendations based on analysis
@@ -51,6 +540,8 @@ class AIRecommendationService:
             company_data: All collected company data
             decision_makers: List of identified decision makers
             is_financial: Whether it's a financial services company
+            deterministic: Generate at temperature 0 so the result can be cached
+            model: OpenAI model to use instead of the default (e.g. "gpt-4-turbo")
             
         Returns:
             Dictionary with AI-generated recommendations
@@ -69,11 +560,23 @@ class AIRecommendationService:
                 company_data, decision_makers, is_financial
             )
             
+            # Reuse recommendations generated for a near-identical prospect
+            embedding = None
+            if self.semantic_cache is not None:
+                embedding = await self._embed(context)
+                match = self.semantic_cache.get(embedding) if embedding else None
+                if match:
+                    matched_name, matched_recommendations = match
+                    logger.info("Reusing %s's recommendations for %s", matched_name, company_name)
+                    return _rename_company(matched_recommendations, matched_name, company_name)
+            
             # Generate recommendations using OpenAI
-            recommendations = await self._call_openai(context)
+            recommendations = await self._call_openai(context, temperature=0 if deterministic else 0.7, model=model)
             
             if recommendations:
                 logger.info(f"Generated AI-powered recommendations for {company_name}")
+                if embedding:
+                    self.semantic_cache.set(embedding, (company_name, recommendations))
                 return recommendations
             else:
                 logger.warning("OpenAI call failed, using template recommendations")
@@ -82,11 +585,210 @@ class AIRecommendationService:
                 )
                 
         except Exception as e:
-            logger.error(f"Error generating AI recommendations: {e}")
+            logger.error("Error generating AI recommendations: %s", e)
             return self._get_template_recommendations(
                 company_name, ai_readiness_score, component_scores, is_financial
             )
     
+    async def generate_sales_recommendations_stream(
+        self,
+        company_name: str,
+        ai_readiness_score: int,
+        component_scores: Dict[str, int],
+        company_data: Dict[str, Any],
+        decision_makers: List[Dict[str, Any]],
+        is_financial: bool = False,
+        model: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream sales recommendations as OpenAI generates them
+        Each yield holds every field completed so far, so callers can show the
+        sales strategy while the rest is still being written
+        
+        Args:
+            Same as generate_sales_recommendations
+            
+        Yields:
+            Progressively more complete recommendations, a single template
+            result without an API key or if nothing could be generated
+        """
+        recommendations: Dict[str, Any] = {}
+        
+        if self.api_key:
+            context = self._prepare_context(
+                company_name, ai_readiness_score, component_scores,
+                company_data, decision_makers, is_financial
+            )
+            payload = {**self._recommendation_payload(context, model=model), "stream": True}
+            
+            try:
+                async with self._http_client() as client:
+                    async with client.stream(
+                        "POST",
+                        f"{self.BASE_URL}/chat/completions",
+                        headers={
+                            "Authorization": f"Bearer {self._next_api_key()}",
+                            "Content-Type": "application/json"
+                        },
+                        content=orjson.dumps(payload),
+                        timeout=30
+                    ) as response:
+                        if response.status_code != 200:
+                            await response.aread()
+                            logger.error("OpenAI API error: %s - %s", response.status_code, response.text)
+                        else:
+                            # Server-sent events, one "data: {...}" line per content delta
+                            buffer = ""
+                            pos = 0
+                            async for line in response.aiter_lines():
+                                if not line.startswith("data: "):
+                                    continue
+                                data = line[len("data: "):]
+                                if data == "[DONE]":
+                                    break
+                                choices = orjson.loads(data).get("choices")
+                                delta = choices[0]["delta"].get("content") if choices else None
+                                if not delta:
+                                    continue
+                                buffer += delta
+                                fields, pos = _parse_completed_fields(buffer, pos)
+                                if fields:
+                                    recommendations.update(fields)
+                                    yield dict(recommendations)
+            except Exception as e:
+                logger.error("Error streaming AI recommendations: %s", e)
+        
+        if not recommendations:
+            yield self._get_template_recommendations(
+                company_name, ai_readiness_score, component_scores, is_financial
+            )
+    
+    async def generate_sales_recommendations_batch(
+        self,
+        prospects: List[Dict[str, Any]],
+        max_concurrency: int = 10,
+        use_batch_api: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate recommendations for several prospects concurrently
+        
+        Args:
+            prospects: Keyword arguments for generate_sales_recommendations, one dict per prospect
+            max_concurrency: Most OpenAI calls in flight at once, keep it within
+                the account's rate limits and the HTTP client's connection pool
+            use_batch_api: Go through OpenAI's Batch API instead, half the cost
+                but results can take hours (offline runs only)
+            
+        Returns:
+            Recommendations in the same order as prospects
+        """
+        if use_batch_api:
+            return await self.generate_sales_recommendations_batch_api(prospects)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(prospect: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_sales_recommendations(**prospect)
+        
+        # Failures already fall back to templates, so one prospect can't sink the batch
+        return await asyncio.gather(*(generate(prospect) for prospect in prospects))
+    
+    async def generate_sales_recommendations_batch_api(
+        self,
+        prospects: List[Dict[str, Any]],
+        poll_interval: float = BATCH_POLL_SECONDS
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate recommendations through OpenAI's Batch API
+        Uploads every request as one JSONL file, waits for the batch to finish
+        and falls back to templates for any prospect without a usable result
+        
+        Args:
+            prospects: Keyword arguments for generate_sales_recommendations, one dict per prospect
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            Recommendations in the same order as prospects
+        """
+        def template(prospect: Dict[str, Any]) -> Dict[str, Any]:
+            return self._get_template_recommendations(
+                prospect["company_name"], prospect["ai_readiness_score"],
+                prospect["component_scores"], prospect.get("is_financial", False)
+            )
+        
+        if not self.api_key or not prospects:
+            return [template(prospect) for prospect in prospects]
+        
+        # custom_id is the prospect's position, company names needn't be unique
+        lines = []
+        for index, prospect in enumerate(prospects):
+            context = self._prepare_context(
+                prospect["company_name"], prospect["ai_readiness_score"], prospect["component_scores"],
+                prospect["company_data"], prospect["decision_makers"], prospect.get("is_financial", False)
+            )
+            payload = self._recommendation_payload(
+                context, temperature=0 if prospect.get("deterministic") else 0.7, model=prospect.get("model")
+            )
+            lines.append(orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": payload
+            }))
+        
+        # Files and batches belong to one project, so the whole job uses one key
+        headers = {"Authorization": f"Bearer {self._next_api_key()}"}
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            async with self._http_client() as client:
+                upload = await client.post(
+                    f"{self.BASE_URL}/files",
+                    headers=headers,
+                    data={"purpose": "batch"},
+                    files={"file": ("recommendations.jsonl", b"\n".join(lines), "application/jsonl")},
+                    timeout=60
+                )
+                upload.raise_for_status()
+                
+                response = await client.post(
+                    f"{self.BASE_URL}/batches",
+                    headers=headers,
+                    json={
+                        "input_file_id": upload.json()["id"],
+                        "endpoint": "/v1/chat/completions",
+                        "completion_window": "24h"
+                    },
+                    timeout=30
+                )
+                response.raise_for_status()
+                batch = response.json()
+                logger.info("Submitted OpenAI batch %s with %s prospects", batch["id"], len(prospects))
+                
+                while batch["status"] not in BATCH_FINAL_STATUSES:
+                    await asyncio.sleep(poll_interval)
+                    response = await client.get(f"{self.BASE_URL}/batches/{batch['id']}", headers=headers, timeout=30)
+                    response.raise_for_status()
+                    batch = response.json()
+                
+                if batch["status"] != "completed":
+                    logger.error("OpenAI batch %s ended as %s", batch["id"], batch["status"])
+                
+                # Expired or cancelled batches can still carry partial output
+                if batch.get("output_file_id"):
+                    output = await client.get(
+                        f"{self.BASE_URL}/files/{batch['output_file_id']}/content",
+                        headers=headers,
+                        timeout=60
+                    )
+                    output.raise_for_status()
+                    # Output files grow with the batch, parse off the event loop
+                    results = await asyncio.to_thread(_parse_batch_output, output.text)
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            logger.error("Error running OpenAI batch: %s", e)
+        
+        return [results.get(str(index)) or template(prospect) for index, prospect in enumerate(prospects)]
+    
     def _prepare_context(
         self,
         company_name: str,
@@ -103,151 +805,74 @@ class AIRecommendationService:
         news_data = company_data.get("news_insights", {})
         tech_signals = company_data.get("tech_signals", {})
         
-        context = f"""
-Company Analysis for {company_name}:
-
-AI Readiness Score: {ai_readiness_score}/100
-Industry: {'Financial Services' if is_financial else 'General'}
-
-Component Scores:
-"""
+        parts = [_CONTEXT_HEADER_TEMPLATE.format(
+            company_name=company_name,
+            score=ai_readiness_score,
+            industry='Financial Services' if is_financial else 'General'
+        )]
         
         # Add component scores
-        for component, score in component_scores.items():
-            context += f"- {component.replace('_', ' ').title()}: {score}/100\n"
+        parts.extend(
+            f"- {component.replace('_', ' ').title()}: {score}/100"
+            for component, score in component_scores.items()
+        )
         
         # Add job posting insights
         if job_data:
-            context += f"""
-            
-Hiring Signals:
-- Total tech jobs: {job_data.get('total_jobs', 0)}
-- AI/ML roles: {job_data.get('ai_ml_jobs', 0)}
-- AI hiring intensity: {job_data.get('ai_hiring_intensity', 'low')}
-"""
+            parts.append(_HIRING_SIGNALS_TEMPLATE.format(
+                total_jobs=job_data.get('total_jobs', 0),
+                ai_ml_jobs=job_data.get('ai_ml_jobs', 0),
+                intensity=job_data.get('ai_hiring_intensity', 'low')
+            ))
         
         # Add tech signals
         if tech_signals:
-            context += f"""
-            
-Technology Indicators:
-- AI mentions on website: {tech_signals.get('ai_mentions', 0)}
-- Tech stack detected: {', '.join(tech_signals.get('tech_stack', [])[:5])}
-"""
+            parts.append(_TECH_INDICATORS_TEMPLATE.format(
+                ai_mentions=tech_signals.get('ai_mentions', 0),
+                tech_stack=', '.join(tech_signals.get('tech_stack', [])[:5])
+            ))
         
         # Add news insights
         if news_data:
-            context += f"""
-            
-Recent News & Trends:
-- Articles analyzed: {news_data.get('articles_analyzed', 0)}
-- Tech focus score: {news_data.get('tech_focus_score', 0)}/100
-- Recent trends: {', '.join(news_data.get('recent_trends', [])[:3])}
-"""
+            parts.append(_NEWS_TEMPLATE.format(
+                articles=news_data.get('articles_analyzed', 0),
+                tech_focus=news_data.get('tech_focus_score', 0),
+                trends=', '.join(news_data.get('recent_trends', [])[:3])
+            ))
         
         # Add decision makers
         if decision_makers:
-            context += f"""
-            
-Key Decision Makers Identified: {len(decision_makers)}
-Top roles: {', '.join([dm.get('title', '') for dm in decision_makers[:3]])}
-"""
+            parts.append(_DECISION_MAKERS_TEMPLATE.format(
+                count=len(decision_makers),
+                roles=', '.join([dm.get('title', '') for dm in decision_makers[:3]])
+            ))
         
-        return context
+        return "\n".join(parts) + "\n"
     
-    async def _call_openai(self, context: str) -> Optional[Dict[str, Any]]:
-        """Call OpenAI API to generate recommendations"""
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        prompt = f"""
-You are a sales strategist for ModelML, an AI infrastructure platform that helps enterprises deploy and scale AI models.
-
-Based on the following company analysis, generate specific, actionable sales recommendations.
-
-{context}
-
-Generate a JSON response with the following structure:
-{{
-    "sales_strategy": "High-level approach (2-3 sentences)",
-    "priority_level": "high/medium/low",
-    "estimated_deal_size": "Range like $500K-$1M",
-    "timeline": "Immediate/3-6 months/6-12 months",
-    "key_talking_points": [
-        "Specific value prop 1",
-        "Specific value prop 2",
-        "Specific value prop 3"
-    ],
-    "recommended_use_cases": [
-        "Use case 1 based on their industry/needs",
-        "Use case 2",
-        "Use case 3"
-    ],
-    "objection_handling": [
-        {{"objection": "Likely concern 1", "response": "How to address it"}},
-        {{"objection": "Likely concern 2", "response": "How to address it"}}
-    ],
-    "next_steps": [
-        "Immediate action 1",
-        "Follow-up action 2",
-        "Long-term action 3"
-    ],
-    "competitive_positioning": "How ModelML compares to alternatives they might consider",
-    "success_metrics": [
-        "KPI they care about 1",
-        "KPI they care about 2"
-    ]
-}}
-
-IMPORTANT RULES for key_talking_points:
-- Do NOT start with "You're", "Your", "You have", "You are", etc.
-- Start with factual statements or direct benefits
-- Example: Instead of "You're hiring aggressively", write "Aggressive AI talent hiring (42 open positions)"
-- Example: Instead of "Your recent initiative", write "Recent Goldman Sachs AI-Powered Trading Platform aligns with ModelML"
-- Make them crisp, factual, and professional
-
-Make the recommendations specific to their AI readiness level and industry. Be concrete and actionable.
-"""
+    def _recommendation_payload(self, context: str, temperature: float = 0.7, model: Optional[str] = None) -> Dict[str, Any]:
+        """Chat completion request body for a company's sales recommendations"""
+        prompt = self._STATIC_SALES_PROMPT_PREFIX + context
         
-        payload = {
-            "model": self.model,
+        return {
+            "model": model or self.model,
             "messages": [
                 {"role": "system", "content": "You are a B2B sales strategist specializing in AI/ML infrastructure sales."},
                 {"role": "user", "content": prompt}
             ],
-            "temperature": 0.7,
-            "max_tokens": 1500,
+            "temperature": temperature,
+            "max_tokens": 900,
             "response_format": {"type": "json_object"}
         }
+    
+    async def _call_openai(self, context: str, temperature: float = 0.7, model: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Call OpenAI API to generate recommendations"""
+        
+        payload = self._recommendation_payload(context, temperature, model)
         
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    
-                    # Parse JSON response
-                    try:
-                        recommendations = json.loads(content)
-                        return recommendations
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse OpenAI JSON response")
-                        return None
-                else:
-                    logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
-                    return None
-                    
+            return await self._chat_completion(payload, timeout=30)
         except Exception as e:
-            logger.error(f"Error calling OpenAI API: {e}")
+            logger.error("Error calling OpenAI API: %s", e)
             return None
     
     async def generate_personalized_outreach(
@@ -255,7 +880,8 @@ Make the recommendations specific to their AI readiness level and industry. Be c
         decision_maker: Dict[str, Any],
         company_name: str,
         ai_readiness_score: int,
-        key_insights: List[str]
+        key_insights: List[str],
+        deterministic: bool = False
     ) -> Dict[str, Any]:
         """
         Generate personalized outreach messaging for a specific decision maker
@@ -265,6 +891,7 @@ Make the recommendations specific to their AI readiness level and industry. Be c
             company_name: Company name
             ai_readiness_score: AI readiness score
             key_insights: Key insights about the company
+            deterministic: Generate at temperature 0 so the result can be cached
             
         Returns:
             Personalized outreach strategy
@@ -274,9 +901,7 @@ Make the recommendations specific to their AI readiness level and industry. Be c
             return self._get_template_outreach(decision_maker, company_name)
         
         try:
-            prompt = f"""
-Generate a personalized outreach strategy for:
-
+            prompt = self._STATIC_OUTREACH_PROMPT_PREFIX + f"""
 Decision Maker: {decision_maker.get('name', 'Executive')}
 Title: {decision_maker.get('title', 'Unknown')}
 Company: {company_name}
@@ -284,54 +909,109 @@ AI Readiness: {ai_readiness_score}/100
 
 Key Insights:
 {chr(10).join(['- ' + insight for insight in key_insights[:5]])}
-
-Create a JSON response with:
-{{
-    "email_subject_lines": [3 compelling subject lines],
-    "opening_line": "Personalized opening that references their role/company",
-    "value_proposition": "2-3 sentences on ModelML's specific value for them",
-    "social_proof": "Relevant customer success story or metric",
-    "call_to_action": "Specific next step",
-    "linkedin_message": "Short LinkedIn outreach message (under 300 chars)",
-    "talking_points": [3 specific points for a call]
-}}
-
-IMPORTANT: For talking_points, do NOT start with "You", "Your", etc. Use factual, professional language.
 """
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": "gpt-3.5-turbo",  # Faster for simple outreach
                 "messages": [
                     {"role": "system", "content": "You are a B2B sales expert crafting personalized outreach."},
                     {"role": "user", "content": prompt}
                 ],
-                "temperature": 0.8,
+                "temperature": 0 if deterministic else 0.8,
                 "max_tokens": 800,
                 "response_format": {"type": "json_object"}
             }
             
-            async with httpx.AsyncClient(timeout=20) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    return json.loads(content)
+            outreach = await self._chat_completion(payload, timeout=20)
+            if outreach:
+                return outreach
                     
         except Exception as e:
-            logger.error(f"Error generating personalized outreach: {e}")
+            logger.error("Error generating personalized outreach: %s", e)
         
         return self._get_template_outreach(decision_maker, company_name)
     
+    async def generate_personalized_outreach_batch(
+        self,
+        decision_makers: List[Dict[str, Any]],
+        company_name: str,
+        ai_readiness_score: int,
+        key_insights: List[str],
+        deterministic: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate personalized outreach for several decision makers in one OpenAI call
+        The instructions and company context are sent once instead of per person
+        
+        Args:
+            decision_makers: Decision makers at the company
+            company_name: Company name
+            ai_readiness_score: AI readiness score
+            key_insights: Key insights about the company
+            deterministic: Generate at temperature 0 so the result can be cached
+            
+        Returns:
+            Outreach strategies in the same order as decision_makers
+        """
+        
+        if not decision_makers:
+            return []
+        
+        outreach_by_id: Dict[int, Dict[str, Any]] = {}
+        if self.api_key:
+            try:
+                people = "\n".join(
+                    f"{number}. {dm.get('name', 'Executive')}, {dm.get('title', 'Unknown')}"
+                    for number, dm in enumerate(decision_makers, 1)
+                )
+                prompt = self._STATIC_OUTREACH_BATCH_PROMPT_PREFIX + f"""Company: {company_name}
+AI Readiness: {ai_readiness_score}/100
+
+Key Insights:
+{chr(10).join(['- ' + insight for insight in key_insights[:5]])}
+
+Decision Makers:
+{people}
+"""
+                
+                payload = {
+                    "model": "gpt-3.5-turbo",  # Faster for simple outreach
+                    "messages": [
+                        {"role": "system", "content": "You are a B2B sales expert crafting personalized outreach."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0 if deterministic else 0.8,
+                    "max_tokens": 800 * len(decision_makers),
+                    "response_format": {"type": "json_object"}
+                }
+                
+                result = await self._chat_completion(payload, timeout=30)
+                for entry in (result or {}).get("outreach", []):
+                    if not isinstance(entry, dict):
+                        continue
+                    # The model sometimes numbers people as strings ("1")
+                    try:
+                        number = int(entry.get("id"))
+                    except (TypeError, ValueError):
+                        logger.warning("Skipping outreach entry with invalid id: %r", entry.get("id"))
+                        continue
+                    # Copied rather than popped, cached results are shared
+                    outreach_by_id[number] = {k: v for k, v in entry.items() if k != "id"}
+                    
+            except Exception as e:
+                logger.error("Error generating personalized outreach: %s", e)
+        
+        # Anyone the model skipped gets the template
+        outreach = []
+        for number, dm in enumerate(decision_makers, 1):
+            entry = outreach_by_id.get(number)
+            if not entry:
+                if self.api_key:
+                    logger.warning("No generated outreach for decision maker %s, using template", number)
+                entry = self._get_template_outreach(dm, company_name)
+            outreach.append(entry)
+        return outreach
+    
     def _get_template_recommendations(
         self,
         company_name: str,
@@ -341,75 +1021,29 @@ IMPORTANT: For talking_points, do NOT start with "You", "Your", etc. Use factual
     ) -> Dict[str, Any]:
         """Fallback template-based recommendations"""
         
-        # Determine priority based on score
-        if ai_readiness_score >= 70:
-            priority = "high"
-            timeline = "Immediate"
-            deal_size = "$1M-$3M"
-            strategy = f"{company_name} shows strong AI readiness. Position ModelML as the platform to scale their existing AI initiatives enterprise-wide."
-        elif ai_readiness_score >= 40:
-            priority = "medium"
-            timeline = "3-6 months"
-            deal_size = "$500K-$1M"
-            strategy = f"{company_name} is building AI capabilities. ModelML can accelerate their journey with pre-built models and infrastructure."
-        else:
-            priority = "low"
-            timeline = "6-12 months"
-            deal_size = "$250K-$500K"
-            strategy = f"{company_name} is early in AI adoption. Focus on education and quick wins with ModelML's turnkey solutions."
+        # Readiness band: the first whose minimum score is met
+        _, priority, timeline, deal_size, strategy = next(
+            (band for band in _TEMPLATE_BANDS if ai_readiness_score >= band[0]), _TEMPLATE_BANDS[-1]
+        )
         
         # Industry-specific talking points
         if is_financial:
-            talking_points = [
-                "Regulatory-compliant AI models designed for financial services",
-                "Pre-built fraud detection and risk assessment models available",
-                "SOC 2 Type II certification with bank-grade security standards"
-            ]
-            use_cases = [
-                "Real-time fraud detection and prevention",
-                "Credit risk assessment and underwriting",
-                "Regulatory compliance automation"
-            ]
+            talking_points, use_cases = _FINANCIAL_TALKING_POINTS, _FINANCIAL_USE_CASES
         else:
-            talking_points = [
-                "AI deployment timeline reduced from months to weeks",
-                "Seamless scaling from prototype to production environment",
-                "Enterprise-grade security and governance built-in"
-            ]
-            use_cases = [
-                "Customer service automation",
-                "Predictive analytics for operations",
-                "Document processing and extraction"
-            ]
+            talking_points, use_cases = _GENERAL_TALKING_POINTS, _GENERAL_USE_CASES
         
+        # Tuples are shared across calls, dicts are copied since callers can mutate them
         return {
-            "sales_strategy": strategy,
+            "sales_strategy": strategy.format(company_name=company_name),
             "priority_level": priority,
             "estimated_deal_size": deal_size,
             "timeline": timeline,
             "key_talking_points": talking_points,
             "recommended_use_cases": use_cases,
-            "objection_handling": [
-                {
-                    "objection": "We don't have AI expertise",
-                    "response": "ModelML provides pre-built models and full support, no ML expertise required"
-                },
-                {
-                    "objection": "Concerned about cost",
-                    "response": "ModelML typically delivers ROI within 6 months through efficiency gains"
-                }
-            ],
-            "next_steps": [
-                f"Schedule discovery call with {company_name}'s CTO/CDO",
-                "Prepare customized demo focusing on their use cases",
-                "Share relevant case studies from their industry"
-            ],
-            "competitive_positioning": "Unlike generic platforms, ModelML provides industry-specific models and compliance features",
-            "success_metrics": [
-                "Time to deploy first AI model",
-                "Cost savings from automation",
-                "Improvement in decision accuracy"
-            ]
+            "objection_handling": [dict(objection) for objection in _TEMPLATE_OBJECTIONS],
+            "next_steps": (f"Schedule discovery call with {company_name}'s CTO/CDO",) + _TEMPLATE_NEXT_STEPS,
+            "competitive_positioning": _TEMPLATE_COMPETITIVE_POSITIONING,
+            "success_metrics": _TEMPLATE_SUCCESS_METRICS
         }
     
     def _get_template_outreach(
@@ -421,21 +1055,18 @@ IMPORTANT: For talking_points, do NOT start with "You", "Your", etc. Use factual
         
         title = decision_maker.get('title', 'Executive')
         name = decision_maker.get('name', 'there')
+        first_name = name.split()[0] if name != 'there' else ''
         
         return {
             "email_subject_lines": [
                 f"Quick question about {company_name}'s AI initiatives",
-                f"{name.split()[0] if name != 'there' else 'Hi'} - 15 min to discuss AI scaling?",
+                f"{first_name or 'Hi'} - 15 min to discuss AI scaling?",
                 f"How {company_name} can deploy AI 10x faster"
             ],
             "opening_line": f"Hi {name}, I noticed {company_name} is expanding its tech capabilities and thought you might be interested in how we're helping similar companies scale their AI initiatives.",
             "value_proposition": f"ModelML helps companies like {company_name} deploy production-ready AI models in weeks instead of months. Our platform handles the infrastructure complexity so your team can focus on business value.",
             "social_proof": "We recently helped a similar company reduce their AI deployment time by 75% while improving model accuracy by 30%.",
             "call_to_action": "Would you be open to a brief 15-minute call next week to explore if ModelML could accelerate your AI roadmap?",
-            "linkedin_message": f"Hi {name.split()[0] if name != 'there' else ''}, I help companies like {company_name} scale AI faster. Worth a quick chat?",
-            "talking_points": [
-                f"How ModelML aligns with {company_name}'s digital transformation goals",
-                "Quick wins we can deliver in the first 30 days",
-                "ROI and success metrics from similar implementations"
-            ]
+            "linkedin_message": f"Hi {first_name}, I help companies like {company_name} scale AI faster. Worth a quick chat?",
+            "talking_points": (f"How ModelML aligns with {company_name}'s digital transformation goals",) + _TEMPLATE_OUTREACH_TALKING_POINTS
         }
\ No newline at end of file
@@ -9,27 +9,58 @@ import asyncio
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import json
+import orjson
 from dotenv import load_dotenv
 from pathlib import Path
 import time
+import random
 import re
 
+from .http import HTTPClientMixin
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
 logger = logging.getLogger(__name__)
 
+_YEAR_PATTERN = re.compile(r'\d{4}')
+
+# Decision-maker position keywords, matched anywhere in the lowercased title
+_RELEVANT_POSITION_KEYWORDS = (
+    "chief", "cto", "cdo", "cio", "vp", "vice president",
+    "director", "head", "manager", "lead",
+    "technology", "data", "ai", "ml", "machine learning",
+    "engineering", "innovation", "digital", "analytics"
+)
+_RELEVANT_POSITION_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in _RELEVANT_POSITION_KEYWORDS))
+
+# Skills reported from a profile's about section, in priority order, matched as whole words
+_SKILL_TITLES = {
+    keyword: keyword.title() for keyword in (
+        "python", "java", "javascript", "ai", "machine learning",
+        "data science", "cloud", "aws", "azure", "docker", "kubernetes",
+        "tensorflow", "pytorch", "sql", "nosql", "microservices"
+    )
+}
+_SKILL_PATTERN = re.compile(r'\b(?:' + "|".join(re.escape(keyword) for keyword in _SKILL_TITLES) + r')\b')
+
+# Snapshot polling backs off exponentially with full jitter, so small jobs
+# are picked up within a second or two and long ones are polled every ~10s
+POLL_INITIAL_DELAY_SECONDS = 0.5
+POLL_MAX_DELAY_SECONDS = 10.0
+POLL_TIMEOUT_SECONDS = 120.0
+
 
-class BrightDataCorrectService:
+class BrightDataCorrectService(HTTPClientMixin):
     """
     Corrected service for BrightData Web Scraper API
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize BrightData service"""
         self.api_key = os.getenv("BRIGHT_DATA_API")
+        self.client = client  # Shared HTTP client, a client per call if None
         self.customer_id = "hl_8eedc246"  # From your URL
         self.dataset_id = "gd_l1viktl72bvl7bjuj0"  # Your dataset/scraper ID
         
@@ -52,6 +83,12 @@ class BrightDataCorrectService:
         if not self.api_key:
             return None
         
+        # BrightData bills per URL, drop repeats while keeping the order
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) < len(urls):
+            logger.debug("Dropped %s duplicate LinkedIn URLs before triggering scraper", len(urls) - len(unique_urls))
+        urls = unique_urls
+        
         try:
             # BrightData uses Bearer token authentication
             headers = {
@@ -65,24 +102,25 @@ class BrightDataCorrectService:
             # Correct endpoint format with query parameters
             endpoint = f"{self.base_url}/datasets/v3/trigger?dataset_id={self.dataset_id}&include_errors=true"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     endpoint,
                     headers=headers,
-                    json=payload
+                    content=orjson.dumps(payload),
+                    timeout=60.0
                 )
                 
                 if response.status_code in [200, 201, 202]:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     snapshot_id = result.get("snapshot_id")
                     logger.info(f"Successfully triggered scraper, snapshot_id: {snapshot_id}")
                     return snapshot_id
                 else:
-                    logger.error(f"Failed to trigger scraper: {response.status_code} - {response.text}")
+                    logger.error("Failed to trigger scraper: %s - %s", response.status_code, response.text)
                     return None
             
         except Exception as e:
-            logger.error(f"Error triggering BrightData scraper: {e}")
+            logger.error("Error triggering BrightData scraper: %s", e)
             return None
     
     async def get_results(self, snapshot_id: str) -> Optional[List[Dict[str, Any]]]:
@@ -106,64 +144,76 @@ class BrightDataCorrectService:
             # Correct endpoint for getting snapshot results
             endpoint = f"{self.base_url}/datasets/v3/snapshot/{snapshot_id}"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Poll for results with retries
-                max_retries = 10
-                retry_delay = 10  # seconds
+            async with self._http_client() as client:
+                # Poll for results until the snapshot is ready or time runs out
+                deadline = time.monotonic() + POLL_TIMEOUT_SECONDS
+                attempt = 0
                 
-                for attempt in range(max_retries):
-                    response = await client.get(endpoint, headers=headers)
-                    
-                    if response.status_code == 200:
-                        # Check if it's JSON (still processing) or actual data
-                        content_type = response.headers.get("content-type", "")
-                        
-                        if "application/json" in content_type:
-                            # Still processing, check status
-                            data = response.json()
-                            if data.get("status") == "running":
-                                logger.info(f"Snapshot still processing, attempt {attempt + 1}/{max_retries}")
-                                if attempt < max_retries - 1:
-                                    await asyncio.sleep(retry_delay)
-                                    continue
+                while True:
+                    attempt += 1
+                    # Streamed so a finished snapshot is parsed line by line as it arrives
+                    async with client.stream("GET", endpoint, headers=headers, timeout=60.0) as response:
+                        if response.status_code == 200:
+                            # Check if it's JSON (still processing) or actual data
+                            content_type = response.headers.get("content-type", "")
+                            
+                            if "application/json" in content_type:
+                                # Still processing, check status
+                                await response.aread()
+                                data = orjson.loads(response.content)
+                                if data.get("status") == "running":
+                                    logger.info(f"Snapshot still processing, attempt {attempt}")
+                                else:
+                                    # Some other JSON response
+                                    return None
                             else:
-                                # Some other JSON response
-                                return None
-                        else:
-                            # Got actual data (likely NDJSON format)
-                            text = response.text
-                            if text:
-                                # Parse NDJSON (newline-delimited JSON)
+                                # Got actual data (likely NDJSON format)
                                 results = []
-                                for line in text.strip().split('\n'):
+                                received = False
+                                async for line in response.aiter_lines():
                                     if line:
+                                        received = True
                                         try:
-                                            results.append(json.loads(line))
-                                        except json.JSONDecodeError:
+                                            results.append(orjson.loads(line))
+                                        except orjson.JSONDecodeError:
                                             continue
-                                logger.info(f"Successfully got {len(results)} results")
-                                return results
-                            else:
-                                logger.warning("Received empty response")
-                                return None
+                                if received:
+                                    logger.info(f"Successfully got {len(results)} results")
+                                    return results
+                                else:
+                                    logger.warning("Received empty response")
+                                    return None
+                        
+                        elif response.status_code == 202:
+                            # Still processing
+                            logger.info(f"Snapshot still processing (202), attempt {attempt}")
+                        else:
+                            logger.error("Failed to get results: %s", response.status_code)
+                            return None
                     
-                    elif response.status_code == 202:
-                        # Still processing
-                        logger.info(f"Snapshot still processing (202), attempt {attempt + 1}/{max_retries}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay)
-                            continue
-                    else:
-                        logger.error(f"Failed to get results: {response.status_code}")
-                        return None
+                    delay = self._poll_delay(attempt, response.headers.get("retry-after"))
+                    if time.monotonic() + delay > deadline:
+                        break
+                    await asyncio.sleep(delay)
                 
-                logger.warning("Max retries reached, snapshot still not ready")
+                logger.warning("Polling timed out, snapshot still not ready")
                 return None
             
         except Exception as e:
-            logger.error(f"Error getting BrightData results: {e}")
+            logger.error("Error getting BrightData results: %s", e)
             return None
     
+    @staticmethod
+    def _poll_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds before the next snapshot poll, honoring the server's Retry-After"""
+        if retry_after:
+            try:
+                return min(float(retry_after), POLL_MAX_DELAY_SECONDS)
+            except ValueError:
+                pass  # HTTP-date form, fall back to backoff
+        ceiling = min(POLL_MAX_DELAY_SECONDS, POLL_INITIAL_DELAY_SECONDS * 2 ** min(attempt - 1, 6))
+        return random.uniform(0, ceiling)
+    
     async def search_linkedin_profiles(self, company_name: str, titles: List[str] = None) -> List[Dict[str, Any]]:
         """
         Search for LinkedIn profiles at a company
@@ -464,15 +514,8 @@ class BrightDataCorrectService:
         if company_name.lower() not in current_company:
             return False
         
-        # Check if it's a relevant position
-        relevant_keywords = [
-            "chief", "cto", "cdo", "cio", "vp", "vice president",
-            "director", "head", "manager", "lead",
-            "technology", "data", "ai", "ml", "machine learning",
-            "engineering", "innovation", "digital", "analytics"
-        ]
-        
-        return any(keyword in position for keyword in relevant_keywords)
+        # Check if it's a relevant position, one regex scan instead of a probe per keyword
+        return _RELEVANT_POSITION_PATTERN.search(position) is not None
     
     def _parse_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         """Parse BrightData profile into our format"""
@@ -497,36 +540,25 @@ class BrightDataCorrectService:
         if not experience:
             return 0
         
-        # Look at first job start date
+        # Count from the earliest start date, LinkedIn lists the current job
+        # first so the first entry alone would give the tenure in that role
+        start_years = []
         for exp in experience:
-            start_date = exp.get("start_date", "")
-            if start_date:
-                # Try to extract year
-                import re
-                year_match = re.search(r'\d{4}', start_date)
-                if year_match:
-                    start_year = int(year_match.group())
-                    current_year = datetime.now().year
-                    return current_year - start_year
+            year_match = _YEAR_PATTERN.search(exp.get("start_date") or "")
+            if year_match:
+                start_years.append(int(year_match.group()))
+        if not start_years:
+            return 0
         
-        return 0
+        return datetime.now().year - min(start_years)
     
     def _extract_skills(self, profile: Dict[str, Any]) -> List[str]:
         """Extract relevant skills from profile"""
-        skills = []
-        
-        # From about section
+        # From about section, one regex sweep collects every skill mentioned
         about = profile.get("about", "").lower()
-        skill_keywords = [
-            "python", "java", "javascript", "ai", "machine learning",
-            "data science", "cloud", "aws", "azure", "docker", "kubernetes",
-            "tensorflow", "pytorch", "sql", "nosql", "microservices"
-        ]
-        
-        for keyword in skill_keywords:
-            if keyword in about:
-                skills.append(keyword.title())
+        found = set(_SKILL_PATTERN.findall(about))
         
+        skills = [title for keyword, title in _SKILL_TITLES.items() if keyword in found]
         return skills[:5]  # Top 5 skills
     
     def _get_recent_activity(self, activity: List[Dict]) -> str:
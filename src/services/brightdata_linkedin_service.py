@@ -13,6 +13,8 @@ import json
 from dotenv import load_dotenv
 from pathlib import Path
 
+from .http import HTTPClientMixin
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
@@ -20,14 +22,15 @@ load_dotenv(env_path)
 logger = logging.getLogger(__name__)
 
 
-class BrightDataLinkedInService:
+class BrightDataLinkedInService(HTTPClientMixin):
     """
     Service for collecting LinkedIn data via BrightData Web Scraper API
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize BrightData service"""
         self.api_key = os.getenv("BRIGHT_DATA_API")
+        self.client = client  # Shared HTTP client, a client per call if None
         self.scraper_id = "gd_l1viktl72bvl7bjuj0"  # Your scraper ID
         
         # BrightData API endpoints
@@ -65,12 +68,13 @@ class BrightDataLinkedInService:
                 }
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with self._http_client() as client:
                 # Start the scraping job
                 response = await client.post(
                     self.trigger_url,
                     headers=headers,
-                    json=payload
+                    json=payload,
+                    timeout=60.0
                 )
                 
                 if response.status_code == 200:
@@ -83,20 +87,21 @@ class BrightDataLinkedInService:
                     # Get the results
                     result_response = await client.get(
                         f"{self.dataset_url}?collector={self.scraper_id}&response_id={job_id}",
-                        headers=headers
+                        headers=headers,
+                        timeout=60.0
                     )
                     
                     if result_response.status_code == 200:
                         return self._parse_linkedin_data(result_response.json())
                     else:
-                        logger.error(f"Failed to get results: {result_response.status_code}")
+                        logger.error("Failed to get results: %s", result_response.status_code)
                         return None
                 else:
-                    logger.error(f"Failed to trigger scraper: {response.status_code} - {response.text}")
+                    logger.error("Failed to trigger scraper: %s - %s", response.status_code, response.text)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error scraping LinkedIn profile: {e}")
+            logger.error("Error scraping LinkedIn profile: %s", e)
             return None
     
     async def search_company_employees(self, company_name: str, titles: List[str] = None) -> List[Dict[str, Any]]:
@@ -143,11 +148,12 @@ class BrightDataLinkedInService:
                     }
                 }
                 
-                async with httpx.AsyncClient(timeout=60.0) as client:
+                async with self._http_client() as client:
                     response = await client.post(
                         self.trigger_url,
                         headers=headers,
-                        json=payload
+                        json=payload,
+                        timeout=60.0
                     )
                     
                     if response.status_code == 200:
@@ -160,7 +166,8 @@ class BrightDataLinkedInService:
                         # Get the results
                         result_response = await client.get(
                             f"{self.dataset_url}?collector={self.scraper_id}&response_id={job_id}",
-                            headers=headers
+                            headers=headers,
+                            timeout=60.0
                         )
                         
                         if result_response.status_code == 200:
@@ -173,7 +180,7 @@ class BrightDataLinkedInService:
             return employees[:10]  # Return top 10
             
         except Exception as e:
-            logger.error(f"Error searching for employees: {e}")
+            logger.error("Error searching for employees: %s", e)
             return self._get_mock_employees(company_name)
     
     async def get_company_page(self, company_linkedin_url: str) -> Optional[Dict[str, Any]]:
@@ -202,11 +209,12 @@ class BrightDataLinkedInService:
                 }
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with self._http_client() as client:
                 response = await client.post(
                     self.trigger_url,
                     headers=headers,
-                    json=payload
+                    json=payload,
+                    timeout=60.0
                 )
                 
                 if response.status_code == 200:
@@ -219,20 +227,21 @@ class BrightDataLinkedInService:
                     # Get the results
                     result_response = await client.get(
                         f"{self.dataset_url}?collector={self.scraper_id}&response_id={job_id}",
-                        headers=headers
+                        headers=headers,
+                        timeout=60.0
                     )
                     
                     if result_response.status_code == 200:
                         return self._parse_company_data(result_response.json())
                     else:
-                        logger.error(f"Failed to get company data: {result_response.status_code}")
+                        logger.error("Failed to get company data: %s", result_response.status_code)
                         return None
                 else:
-                    logger.error(f"Failed to trigger company scraper: {response.status_code}")
+                    logger.error("Failed to trigger company scraper: %s", response.status_code)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error getting company page: {e}")
+            logger.error("Error getting company page: %s", e)
             return None
     
     def _parse_linkedin_data(self, data: Any) -> Dict[str, Any]:
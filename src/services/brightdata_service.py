@@ -13,21 +13,27 @@ import json
 from dotenv import load_dotenv
 from pathlib import Path
 
+from .http import HTTPClientMixin
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(env_path)
 
 logger = logging.getLogger(__name__)
 
+# Characters dropped when normalizing a company name into a lookup key
+_COMPANY_KEY_STRIP = str.maketrans("", "", " &.")
+
 
-class BrightDataService:
+class BrightDataService(HTTPClientMixin):
     """
     Service for collecting enhanced company and LinkedIn data via BrightData
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize BrightData service"""
         self.api_key = os.getenv("BRIGHT_DATA_API")
+        self.client = client  # Shared HTTP client, a client per call if None
         self.base_url = "https://api.brightdata.com/datasets/v3"
         
         # Common BrightData dataset IDs
@@ -69,18 +75,18 @@ class BrightDataService:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
+            async with self._http_client() as client:
+                response = await client.post(url, headers=headers, json=payload, timeout=30.0)
                 
                 if response.status_code == 200:
                     data = response.json()
                     return self._parse_linkedin_company(data)
                 else:
-                    logger.error(f"BrightData API error: {response.status_code} - {response.text}")
+                    logger.error("BrightData API error: %s - %s", response.status_code, response.text)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error fetching LinkedIn company data: {e}")
+            logger.error("Error fetching LinkedIn company data: %s", e)
             return None
     
     async def search_decision_makers(self, company_name: str, titles: List[str] = None) -> List[Dict[str, Any]]:
@@ -125,8 +131,8 @@ class BrightDataService:
                     "format": "json"
                 }
                 
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(url, headers=headers, json=payload)
+                async with self._http_client() as client:
+                    response = await client.post(url, headers=headers, json=payload, timeout=30.0)
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -150,7 +156,7 @@ class BrightDataService:
             return unique_dms[:10]  # Return top 10
             
         except Exception as e:
-            logger.error(f"Error searching decision makers: {e}")
+            logger.error("Error searching decision makers: %s", e)
             return []
     
     async def get_company_insights(self, company_domain: str) -> Optional[Dict[str, Any]]:
@@ -179,17 +185,17 @@ class BrightDataService:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=payload)
+            async with self._http_client() as client:
+                response = await client.post(url, headers=headers, json=payload, timeout=30.0)
                 
                 if response.status_code == 200:
                     return response.json()
                 else:
-                    logger.error(f"Failed to get company insights: {response.status_code}")
+                    logger.error("Failed to get company insights: %s", response.status_code)
                     return None
                     
         except Exception as e:
-            logger.error(f"Error getting company insights: {e}")
+            logger.error("Error getting company insights: %s", e)
             return None
     
     def _parse_linkedin_company(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -281,7 +287,7 @@ class BrightDataService:
         }
         
         # Find best match
-        company_key = company_name.lower().replace(" ", "").replace("&", "").replace(".", "")
+        company_key = company_name.lower().translate(_COMPANY_KEY_STRIP)
         for key in mock_companies:
             if key in company_key:
                 return mock_companies[key]
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from pydantic import BaseModel, Field, field_validator
 import logging
 
+from .http import HTTPClientMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,7 +68,7 @@ class RateLimitExceeded(ClearbitAPIError):
     pass
 
 
-class ClearbitService:
+class ClearbitService(HTTPClientMixin):
     """
     Service for interacting with Clearbit Company API
     Includes rate limiting, caching, and error handling
@@ -76,17 +78,20 @@ class ClearbitService:
     MAX_REQUESTS_PER_MINUTE = 600
     CACHE_TTL_HOURS = 24
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Clearbit service
         
         Args:
             api_key: Clearbit API key (defaults to environment variable)
+            client: Shared HTTP client for connection reuse (defaults to a client per call)
         """
         self.api_key = api_key or os.getenv("CLEARBIT_API_KEY")
         if not self.api_key:
             logger.warning("No Clearbit API key provided. Service will use mock data.")
         
+        self.client = client
+        
         # Simple in-memory cache (company_domain -> (data, timestamp))
         self._cache: Dict[str, tuple[Optional[ClearbitCompanyData], datetime]] = {}
         
@@ -94,7 +99,7 @@ class ClearbitService:
         self._request_timestamps: list[datetime] = []
         self._backoff_until: Optional[datetime] = None
         self._backoff_seconds = 1  # Initial backoff time
-        
+    
     async def get_company_data(self, domain: str) -> Optional[ClearbitCompanyData]:
         """
         Fetch company data from Clearbit API or cache
@@ -130,7 +135,7 @@ class ClearbitService:
         
         try:
             # Make API request
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     f"{self.BASE_URL}/find",
                     params={"domain": domain},
@@ -157,16 +162,16 @@ class ClearbitService:
                     raise RateLimitExceeded("Clearbit API rate limit exceeded")
                     
                 else:
-                    logger.error(f"Clearbit API error: {response.status_code} - {response.text}")
+                    logger.error("Clearbit API error: %s - %s", response.status_code, response.text)
                     raise ClearbitAPIError(f"API returned status {response.status_code}")
                     
         except httpx.TimeoutException:
-            logger.error(f"Timeout fetching data for domain: {domain}")
+            logger.error("Timeout fetching data for domain: %s", domain)
             return None
             
         except Exception as e:
             if not isinstance(e, (ClearbitAPIError, RateLimitExceeded)):
-                logger.error(f"Unexpected error fetching Clearbit data: {e}")
+                logger.error("Unexpected error fetching Clearbit data: %s", e)
             raise
     
     def _parse_clearbit_response(self, data: Dict[str, Any]) -> ClearbitCompanyData:
@@ -0,0 +1,66 @@
+"""
+Coalescing of concurrent identical calls, shared by the caches and the services
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _OwnerCancelled(Exception):
+    """The caller running a shared computation was cancelled before it finished"""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single computation
+    Callers arriving while a key is being computed wait for that result
+    instead of starting their own. Exceptions are shared with the waiters,
+    but if the caller running the computation is cancelled the waiters
+    start it again rather than failing with it.
+    """
+
+    def __init__(self):
+        # Computations in progress (key -> future shared by every waiter)
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the result of compute(), joining an in-flight call for key
+
+        Args:
+            key: Identifies calls that can share one result
+            compute: Zero-argument coroutine factory producing the result
+
+        Returns:
+            Result of this call's or the in-flight call's computation
+        """
+        pending = self._futures.get(key)
+        while pending is not None:
+            try:
+                # Shield so a disconnecting waiter doesn't cancel the shared work
+                return await asyncio.shield(pending)
+            except _OwnerCancelled:
+                # The first waiter to wake up takes over, the rest join it
+                pending = self._futures.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            # Only this caller went away, not the requests waiting on it
+            future.set_exception(_OwnerCancelled())
+            future.exception()  # Mark retrieved, there may be no waiters
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved, the exception is re-raised below
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._futures.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._futures)
@@ -18,6 +18,20 @@ class CompanyDatabase:
     def __init__(self):
         """Initialize with a curated list of companies"""
         self.companies = self._initialize_company_list()
+        
+        # Lowercased fields are precomputed once so each autocomplete
+        # keystroke only compares strings instead of re-normalizing every company
+        # (company, name_lower, ticker_lower, name_words)
+        self._search_index = []
+        for company in self.companies:
+            name_lower = company["name"].lower()
+            self._search_index.append(
+                (company, name_lower, company.get("ticker", "").lower(), name_lower.split())
+            )
+        self._companies_by_name: Dict[str, Dict[str, str]] = {}
+        for company in self.companies:
+            self._companies_by_name.setdefault(company["name"].lower(), company)
+        
         logger.info(f"CompanyDatabase initialized with {len(self.companies)} companies")
     
     def _initialize_company_list(self) -> List[Dict[str, str]]:
@@ -252,10 +266,7 @@ class CompanyDatabase:
         matches = []
         
         # Score each company based on match quality
-        for company in self.companies:
-            name_lower = company["name"].lower()
-            ticker_lower = company.get("ticker", "").lower()
-            
+        for company, name_lower, ticker_lower, name_words in self._search_index:
             # Exact match gets highest priority
             if name_lower == query_lower or ticker_lower == query_lower:
                 score = 100
@@ -263,13 +274,13 @@ class CompanyDatabase:
             elif name_lower.startswith(query_lower) or ticker_lower.startswith(query_lower):
                 score = 90
             # Word boundary match (e.g., "Chase" in "JPMorgan Chase")
-            elif any(word.startswith(query_lower) for word in name_lower.split()):
+            elif any(word.startswith(query_lower) for word in name_words):
                 score = 80
             # Contains query anywhere
             elif query_lower in name_lower or query_lower in ticker_lower:
                 score = 70
             # Fuzzy match for typos (simple approach)
-            elif self._fuzzy_match(query_lower, name_lower):
+            elif self._fuzzy_match(query_lower, name_words):
                 score = 60
             else:
                 continue
@@ -285,27 +296,33 @@ class CompanyDatabase:
         # Return top matches
         return [match["company"] for match in matches[:limit]]
     
-    def _fuzzy_match(self, query: str, target: str, max_distance: int = 2) -> bool:
+    def _fuzzy_match(self, query: str, target_words: List[str], max_distance: int = 2) -> bool:
         """
         Simple fuzzy matching for typos
-        Returns True if query is within max_distance edits of any word in target
+        Returns True if query is within max_distance edits of any of the (lowercased) target words
         """
         # For performance, only check if query is reasonably short
         if len(query) > 10:
             return False
         
-        target_words = target.split()
         for word in target_words:
-            if self._levenshtein_distance(query, word.lower()) <= max_distance:
+            # The edit distance is at least the length difference, skip the
+            # full Levenshtein table when that alone rules the word out
+            if abs(len(query) - len(word)) > max_distance:
+                continue
+            if self._levenshtein_distance(query, word, max_distance) <= max_distance:
                 return True
         return False
     
-    def _levenshtein_distance(self, s1: str, s2: str) -> int:
+    def _levenshtein_distance(self, s1: str, s2: str, max_distance: Optional[int] = None) -> int:
         """
         Calculate Levenshtein distance between two strings
+        
+        When max_distance is given, stops as soon as the distance is known to
+        exceed it and returns max_distance + 1
         """
         if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+            return self._levenshtein_distance(s2, s1, max_distance)
         
         if len(s2) == 0:
             return len(s1)
@@ -319,6 +336,9 @@ class CompanyDatabase:
                 deletions = current_row[j] + 1
                 substitutions = previous_row[j] + (c1 != c2)
                 current_row.append(min(insertions, deletions, substitutions))
+            # Row minimums never decrease, so the final distance is at least this
+            if max_distance is not None and min(current_row) > max_distance:
+                return max_distance + 1
             previous_row = current_row
         
         return previous_row[-1]
@@ -333,11 +353,7 @@ class CompanyDatabase:
         Returns:
             Company details if found, None otherwise
         """
-        name_lower = name.lower()
-        for company in self.companies:
-            if company["name"].lower() == name_lower:
-                return company
-        return None
+        return self._companies_by_name.get(name.lower())
     
     def get_financial_companies(self) -> List[Dict[str, str]]:
         """
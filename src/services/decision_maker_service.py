@@ -101,6 +101,44 @@ class DecisionMakerService:
         
         return decision_makers[:5]  # Return top 5 decision makers
     
+    def build_linkedin_decision_maker(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a high-priority decision maker from a BrightData LinkedIn profile
+        
+        Args:
+            profile: LinkedIn profile returned by BrightData
+            
+        Returns:
+            Decision maker with LinkedIn-specific talking points
+        """
+        skills = profile.get("skills", [])
+        experience_years = profile.get("experience_years", 0)
+        recent_activity = profile.get("recent_activity", "")
+        
+        return {
+            "name": profile.get("name", "Unknown"),
+            "title": profile.get("title", "Unknown"),
+            "email": "",  # LinkedIn doesn't provide emails
+            "linkedin": profile.get("linkedin_url", ""),
+            "priority": 1,  # High priority for LinkedIn verified profiles
+            "role": "LinkedIn Verified Profile",
+            "approach": f"Personalized LinkedIn outreach - {profile.get('title', 'Executive')}",
+            "confidence": 95,
+            "skills": skills,
+            "experience_years": experience_years,
+            "followers": profile.get("followers", 0),
+            "connections": profile.get("connections", 0),
+            "about_snippet": (profile.get("about") or "")[:100],
+            "recent_activity": recent_activity,
+            "education": profile.get("education", ""),
+            "talking_points": [
+                f"Connect on expertise in {', '.join(skills[:2])}" if skills else "Discuss industry trends",
+                f"Reference their {experience_years}+ years of experience" if experience_years > 0 else "Acknowledge their leadership role",
+                f"Recent activity: {recent_activity[:50]}" if recent_activity else "ModelML's value for your role",
+                "How ModelML accelerates AI initiatives at scale"
+            ]
+        }
+    
     def _process_contact(self, contact: Dict[str, Any], is_financial: bool) -> Optional[Dict[str, Any]]:
         """
         Process a contact from Hunter.io into a decision maker profile
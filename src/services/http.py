@@ -0,0 +1,29 @@
+"""
+HTTP client sharing for the outbound API services
+"""
+
+import httpx
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+
+class HTTPClientMixin:
+    """
+    Lends a service the pooled HTTP client main.py injects as `client`
+    Services constructed without one (scripts, tests) get a short-lived
+    client per call instead.
+    """
+
+    client: Optional[httpx.AsyncClient] = None
+
+    # Keyword arguments for the short-lived fallback client
+    FALLBACK_CLIENT_OPTIONS: Dict[str, Any] = {}
+
+    @asynccontextmanager
+    async def _http_client(self):
+        """Yield the shared HTTP client, or a short-lived one when none was injected"""
+        if self.client is not None:
+            yield self.client
+        else:
+            async with httpx.AsyncClient(**self.FALLBACK_CLIENT_OPTIONS) as client:
+                yield client
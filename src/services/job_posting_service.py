@@ -13,6 +13,8 @@ import json
 import os
 from dotenv import load_dotenv
 
+from .http import HTTPClientMixin
+
 # Load .env from parent directory if it exists there, otherwise current directory
 from pathlib import Path
 env_path = Path(__file__).parent.parent.parent / '.env'
@@ -22,7 +24,7 @@ load_dotenv(env_path)
 logger = logging.getLogger(__name__)
 
 
-class JobPostingService:
+class JobPostingService(HTTPClientMixin):
     """
     Service for collecting job posting data via JSearch API (RapidAPI)
     Aggregates data from LinkedIn, Indeed, Glassdoor, ZipRecruiter
@@ -75,8 +77,9 @@ class JobPostingService:
         "fraud detection", "anomaly detection", "aml", "kyc", "regulatory reporting"
     ]
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.api_key = os.getenv("RAPIDAPI_KEY")
+        self.client = client  # Shared HTTP client, a client per call if None
         self.cache = {}  # Simple in-memory cache
         self.last_request_time = None
         self.request_count = 0
@@ -132,7 +135,7 @@ class JobPostingService:
             
             query = f"{company_name} software engineer data scientist machine learning"
             
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with self._http_client() as client:
                 for page in range(1, num_pages + 1):
                     params = {
                         "query": query,
@@ -144,7 +147,8 @@ class JobPostingService:
                     response = await client.get(
                         f"{self.BASE_URL}/search",
                         headers=headers,
-                        params=params
+                        params=params,
+                        timeout=30
                     )
                     
                     if response.status_code == 200:
@@ -157,7 +161,7 @@ class JobPostingService:
                         logger.warning("Rate limit hit, waiting before retry...")
                         await asyncio.sleep(60)
                     else:
-                        logger.error(f"JSearch API error: {response.status_code}")
+                        logger.error("JSearch API error: %s", response.status_code)
                         break
             
             # Analyze collected jobs
@@ -169,7 +173,7 @@ class JobPostingService:
             return result
             
         except Exception as e:
-            logger.error(f"Error fetching job postings for {company_name}: {e}")
+            logger.error("Error fetching job postings for %s: %s", company_name, e)
             return self._get_mock_data(company_name)
     
     def _analyze_job_postings(self, company_name: str, jobs: List[Dict]) -> Dict[str, Any]:
@@ -13,6 +13,8 @@ import logging
 import json
 from pathlib import Path
 
+from .http import HTTPClientMixin
+
 # Load environment variables
 env_path = Path(__file__).parent.parent.parent / '.env'
 if not env_path.exists():
@@ -24,15 +26,16 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class NewsService:
+class NewsService(HTTPClientMixin):
     """
     Service for collecting company news mentions and press releases
     Using NewsAPI.org or alternative sources
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize the news collection service"""
         self.api_key = os.getenv("NEWS_API_KEY")
+        self.client = client  # Shared HTTP client, a client per call if None
         self.base_url = "https://newsapi.org/v2"
         self.headers = {
             "X-Api-Key": self.api_key,
@@ -107,7 +110,7 @@ class NewsService:
             else:
                 search_query = f'"{company_name}" AND (AI OR "artificial intelligence" OR "machine learning" OR "digital transformation" OR technology OR automation)'
             
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 # Search everything endpoint for comprehensive results
                 response = await client.get(
                     f"{self.base_url}/everything",
@@ -153,11 +156,11 @@ class NewsService:
                     }
                     
                 else:
-                    logger.error(f"NewsAPI error: {response.status_code}")
+                    logger.error("NewsAPI error: %s", response.status_code)
                     return self._get_mock_news(company_name)
                     
         except Exception as e:
-            logger.error(f"Error fetching news: {e}")
+            logger.error("Error fetching news: %s", e)
             return self._get_mock_news(company_name)
     
     def _process_articles(self, company_name: str, articles: List[Dict], is_financial: bool = False) -> List[Dict]:
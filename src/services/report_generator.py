@@ -210,7 +210,7 @@ class PDFReportGenerator:
             return str(filepath)
             
         except Exception as e:
-            logger.error(f"Error generating PDF report: {e}")
+            logger.error("Error generating PDF report: %s", e)
             raise
     
     def _create_header(self, company_name: str) -> List:
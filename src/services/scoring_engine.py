@@ -6,6 +6,7 @@ Combines signals from multiple sources to calculate comprehensive score
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -441,4 +442,122 @@ class AIReadinessScoringEngine:
                 elif component == "tech_modernization":
                     weaknesses.append("Legacy technology")
         
-        return weaknesses if weaknesses else ["Continue AI journey"]
\ No newline at end of file
+        return weaknesses if weaknesses else ["Continue AI journey"]
+
+
+# Quick /analyze scoring lookup tables (first matching entry wins)
+# Canonical Hunter.io headcount ranges are scored with a direct lookup
+_SIZE_RANGE_SCORES = {
+    "1-10": 8,
+    "11-50": 8,
+    "51-200": 12,
+    "201-500": 12,
+    "501-1000": 15,
+    "1001-5000": 15,
+    "5001-10000": 15,
+    "10000+": 20,
+    "10001+": 20,
+}
+# Any other size format falls back to substring matching
+_SIZE_SCORES = {"10000+": 20, "1000": 15, "500": 12, "100": 12}
+_DEFAULT_SIZE_SCORE = 8
+
+_INDUSTRY_KEYWORDS = {
+    ("artificial", "ai", "machine learning", "technology"): 15,
+    ("software", "internet", "financial", "banking"): 10,
+}
+_DEFAULT_INDUSTRY_SCORE = 5
+
+# Each bucket compiled to one alternation so classifying an industry is a
+# single regex search per bucket instead of a substring probe per keyword
+_INDUSTRY_PATTERNS = tuple(
+    (re.compile("|".join(re.escape(keyword) for keyword in keywords)), points)
+    for keywords, points in _INDUSTRY_KEYWORDS.items()
+)
+
+HUNTER_AI_TECH_KEYWORDS = frozenset(["tensorflow", "pytorch", "python", "aws", "ml", "ai", "data", "kubernetes", "docker"])
+CLEARBIT_AI_TECH_KEYWORDS = frozenset(["tensorflow", "pytorch", "scikit", "ml", "ai", "data"])
+
+
+def _count_ai_tech_keywords(keywords: frozenset, technologies: List[str]) -> int:
+    """Count keywords found (as substrings) in any of the technology names"""
+    # Newline never appears in a keyword, so one scan of the joined names
+    # is equivalent to checking every technology separately
+    tech_text = "\n".join(technologies).lower()
+    return sum(1 for keyword in keywords if keyword in tech_text)
+
+
+def quick_hunter_score(
+    company_size: Optional[str],
+    technologies: Optional[List[str]],
+    industry: Optional[str],
+    contacts: Optional[List[Dict[str, Any]]]
+) -> int:
+    """
+    Quick AI readiness score from Hunter.io domain search fields
+    
+    Args:
+        company_size: Hunter.io size range (e.g. "1000-5000")
+        technologies: Technologies detected on the domain
+        industry: Company industry
+        contacts: Contacts returned by the domain search
+        
+    Returns:
+        Score between 40 and 100
+    """
+    score = 40  # Base score
+    
+    # Company size scoring
+    if company_size:
+        size_score = _SIZE_RANGE_SCORES.get(company_size)
+        if size_score is None:
+            size_score = next(
+                (points for size, points in _SIZE_SCORES.items() if size in company_size),
+                _DEFAULT_SIZE_SCORE
+            )
+        score += size_score
+    
+    # Technology stack scoring
+    if technologies:
+        score += min(_count_ai_tech_keywords(HUNTER_AI_TECH_KEYWORDS, technologies) * 4, 25)
+    
+    # Industry scoring
+    if industry:
+        industry_lower = industry.lower()
+        score += next(
+            (points for pattern, points in _INDUSTRY_PATTERNS if pattern.search(industry_lower)),
+            _DEFAULT_INDUSTRY_SCORE
+        )
+    
+    # Executive contacts bonus
+    if contacts:
+        executive_count = sum(1 for c in contacts if c.get("seniority") == "executive")
+        score += min(executive_count * 3, 10)
+    
+    return min(score, 100)
+
+
+def quick_clearbit_score(employee_count: Optional[int], tech_stack: Optional[List[str]]) -> int:
+    """
+    Quick AI readiness score from Clearbit company fields
+    
+    Args:
+        employee_count: Number of employees
+        tech_stack: Technologies used by the company
+        
+    Returns:
+        Score between 50 and 100
+    """
+    score = 50
+    if employee_count:
+        if employee_count > 1000:
+            score += 20
+        elif employee_count > 100:
+            score += 15
+        else:
+            score += 10
+    
+    if tech_stack:
+        score += min(_count_ai_tech_keywords(CLEARBIT_AI_TECH_KEYWORDS, tech_stack) * 5, 20)
+    
+    return min(score, 100)
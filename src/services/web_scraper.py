@@ -10,10 +10,12 @@ from urllib.parse import urljoin, urlparse
 import re
 import logging
 
+from .http import HTTPClientMixin
+
 logger = logging.getLogger(__name__)
 
 
-class WebScraperService:
+class WebScraperService(HTTPClientMixin):
     """
     Service for scraping company websites to extract technology signals
     """
@@ -44,7 +46,8 @@ class WebScraperService:
         "compliance_tools": ["actimize", "verafin", "fenergo", "accuity", "lexisnexis"]
     }
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.client = client  # Shared HTTP client, a client per call if None
         self.session_timeout = 10.0
         self.user_agents = [
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
@@ -111,13 +114,13 @@ class WebScraperService:
             }
             
         except Exception as e:
-            logger.error(f"Error scraping {domain}: {e}")
+            logger.error("Error scraping %s: %s", domain, e)
             return self._empty_result()
     
     async def _fetch_page(self, url: str) -> Optional[Dict[str, Any]]:
         """Fetch and parse a web page"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     url,
                     headers={
@@ -0,0 +1,22 @@
+"""
+Gunicorn worker class running the app on uvicorn with production tuning
+"""
+
+from uvicorn.workers import UvicornWorker
+
+
+class ProspectUvicornWorker(UvicornWorker):
+    """
+    UvicornWorker with uvloop/httptools and a per-worker concurrency cap
+    Gunicorn's worker_connections isn't forwarded to uvicorn, so the cap is set here
+    """
+    
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        # Shed load with 503s instead of slowing every in-flight analysis
+        "limit_concurrency": 200,
+        # Detect dead WebSocket peers with protocol-level pings
+        "ws_ping_interval": 20.0,
+        "ws_ping_timeout": 20.0,
+    }
@@ -0,0 +1,56 @@
+"""
+Test AI recommendation helpers that run without OpenAI
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from services.ai_recommendation_service import _rename_company
+
+
+def test_rename_company():
+    """Test that reused recommendations swap whole company names only"""
+    print("\n1. Testing company rename...")
+
+    recommendations = {
+        "strategy": "Apple should pilot Apple Intelligence, unlike Pineapple Labs",
+        "talking_points": ["Meta's Metadata team", "Meta, Meta-owned and Metaverse"],
+        "score": 80
+    }
+    renamed = _rename_company(recommendations, "Apple", "Acme")
+    assert renamed["strategy"] == "Acme should pilot Acme Intelligence, unlike Pineapple Labs"
+    assert renamed["score"] == 80
+    assert recommendations["strategy"].startswith("Apple"), "The original should be left unchanged"
+
+    renamed = _rename_company(recommendations, "Meta", "Acme")
+    assert renamed["talking_points"] == ["Acme's Metadata team", "Acme, Acme-owned and Metaverse"]
+    print("✓ Names inside other words are left alone")
+
+    renamed = _rename_company("Yahoo! and Yahoo!s", "Yahoo!", r"A\1 Corp")
+    assert renamed == r"A\1 Corp and Yahoo!s"
+    print("✓ Punctuated names and replacement text are taken literally")
+
+
+def test_import_as_src_package():
+    """Test that the service imports as src.services, as the root-level scripts do"""
+    print("\n2. Testing import from the repo root...")
+
+    # A fresh interpreter, so src/ (added to sys.path above) can't mask a
+    # service importing src modules by their top-level names
+    result = subprocess.run(
+        [sys.executable, "-c", "import src.services.ai_recommendation_service"],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    print("✓ src.services.ai_recommendation_service imports on its own")
+
+
+if __name__ == "__main__":
+    test_rename_company()
+    test_import_as_src_package()
+    print("\n✅ All AI recommendation tests passed!")
@@ -0,0 +1,265 @@
+"""
+Test in-process TTL cache used for analysis responses
+"""
+
+import sys
+from pathlib import Path
+import asyncio
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from cache import TTLCache, SemanticCache, SingleFlight
+
+
+def test_get_and_set():
+    """Test basic storage, eviction and expiry"""
+    print("\n1. Testing get/set and eviction...")
+
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None, "Oldest entry should be evicted"
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    print("✓ Oldest entry evicted when full")
+
+    expired = TTLCache(ttl_seconds=0)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+    assert len(expired) == 0
+    print("✓ Expired entries are dropped")
+
+
+def test_concurrent_misses_coalesce():
+    """Test that concurrent misses for one key run the computation once"""
+    print("\n2. Testing request coalescing...")
+
+    cache = TTLCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"score": 80}
+
+    async def run():
+        return await asyncio.gather(*[cache.get_or_compute("google.com", compute) for _ in range(5)])
+
+    results = asyncio.run(run())
+    assert len(calls) == 1, f"Expected one upstream computation, got {len(calls)}"
+    assert all(r == {"score": 80} for r in results)
+    assert not cache._pending, "Pending computations should be released"
+    print("✓ 5 concurrent requests resolved with 1 computation")
+
+
+def test_errors_not_cached():
+    """Test that failed computations are not cached"""
+    print("\n3. Testing error propagation...")
+
+    cache = TTLCache()
+
+    async def fail():
+        raise RuntimeError("upstream down")
+
+    try:
+        asyncio.run(cache.get_or_compute("x", fail))
+        assert False, "Exception should propagate"
+    except RuntimeError:
+        pass
+    assert cache.get("x") is None
+    print("✓ Exceptions propagate and are not cached")
+
+    calls = []
+
+    async def slow_fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        return await asyncio.gather(*[cache.get_or_compute("y", slow_fail) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    print("✓ Concurrent waiters share a single failure")
+
+
+def test_cacheable_predicate():
+    """Test that values rejected by the cacheable predicate are returned but not stored"""
+    print("\n4. Testing cacheable predicate...")
+
+    cache = TTLCache()
+
+    async def empty_result():
+        return {"domain": ""}
+
+    result = asyncio.run(cache.get_or_compute("a.com", empty_result, cacheable=lambda r: bool(r["domain"])))
+    assert result == {"domain": ""}
+    assert cache.get("a.com") is None
+    print("✓ Rejected values are not cached")
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis.asyncio client methods the cache uses"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.store)
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+def test_shared_redis_layer():
+    """Test that entries are shared across caches through Redis"""
+    print("\n5. Testing shared Redis layer...")
+
+    redis = FakeRedis()
+    first = TTLCache(redis=redis, namespace="news")
+    second = TTLCache(redis=redis, namespace="news")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"articles": [], "total_count": 0}
+
+    asyncio.run(first.get_or_compute(("acme", False), compute))
+    assert "news:acme:False" in redis.store
+    result = asyncio.run(second.get_or_compute(("acme", False), compute))
+    assert result == {"articles": [], "total_count": 0}
+    assert len(calls) == 1, "Second worker should be served from Redis"
+    print("✓ A value computed by one worker is reused by another")
+
+    asyncio.run(second.get_or_compute(("acme", False), compute, refresh=True))
+    assert len(calls) == 2
+    print("✓ refresh bypasses cached values")
+
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+        async def set(self, key, value, ex=None, nx=False):
+            raise ConnectionError("redis down")
+
+    degraded = TTLCache(redis=BrokenRedis())
+    assert asyncio.run(degraded.get_or_compute("x", compute)) == {"articles": [], "total_count": 0}
+    assert degraded.get("x") is not None
+    print("✓ Redis failures fall back to the in-process cache")
+
+
+def test_cross_worker_coalescing():
+    """Test that a miss on one worker waits for another worker computing the same key"""
+    print("\n6. Testing cross-worker coalescing...")
+
+    redis = FakeRedis()
+    workers = [TTLCache(redis=redis, namespace="analysis") for _ in range(3)]
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.3)
+        return {"score": 80}
+
+    async def run():
+        return await asyncio.gather(*[worker.get_or_compute("acme.com", compute) for worker in workers])
+
+    results = asyncio.run(run())
+    assert len(calls) == 1, f"Expected one computation across workers, got {len(calls)}"
+    assert all(r == {"score": 80} for r in results)
+    assert "lock:analysis:acme.com" not in redis.store, "Lock should be released"
+    print("✓ 3 workers resolved with 1 computation")
+
+
+def test_semantic_cache():
+    """Test that lookups match similar embeddings only and the oldest entries are evicted"""
+    print("\n7. Testing semantic cache...")
+
+    cache = SemanticCache(maxsize=2, threshold=0.95)
+    cache.set([1.0, 0.0, 0.0], "fintech")
+    cache.set([0.0, 1.0, 0.0], "retail")
+
+    assert cache.get([2.0, 0.1, 0.0]) == "fintech", "Scaled, nearly parallel vector should match"
+    assert cache.get([1.0, 1.0, 0.0]) is None, "Dissimilar vector should miss"
+
+    cache.set([0.0, 0.0, 1.0], "health")
+    assert len(cache) == 2
+    assert cache.get([1.0, 0.0, 0.0]) is None, "Oldest entry should be evicted"
+    assert cache.get([0.0, 0.1, 1.0]) == "health"
+    print("✓ Similar embeddings hit, others miss, oldest evicted")
+
+
+def test_single_flight():
+    """Test that uncached concurrent calls share one computation and its error"""
+    print("\n8. Testing single-flight coalescing...")
+
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    async def run():
+        return await asyncio.gather(*[flights.run("prompt", compute) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert len(calls) == 1, f"Expected one computation, got {len(calls)}"
+    assert all(isinstance(r, ValueError) for r in results), "Waiters should share the error"
+    assert len(flights) == 0, "Finished computations should be released"
+    print("✓ 3 concurrent calls shared 1 failed computation")
+
+
+def test_single_flight_owner_cancelled():
+    """Test that cancelling the caller running a computation doesn't fail its waiters"""
+    print("\n9. Testing single-flight owner cancellation...")
+
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "completion"
+
+    async def run():
+        owner = asyncio.create_task(flights.run("prompt", compute))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(flights.run("prompt", compute)) for _ in range(2)]
+        await asyncio.sleep(0)
+        owner.cancel()
+        results = await asyncio.gather(*waiters)
+        return owner, results
+
+    owner, results = asyncio.run(run())
+    assert owner.cancelled(), "The cancelled owner should see its own cancellation"
+    assert results == ["completion", "completion"], "Waiters should still get a value"
+    assert len(calls) == 2, f"Waiters should share one rerun, got {len(calls)} computations"
+    assert len(flights) == 0, "Finished computations should be released"
+    print("✓ Waiters reran the computation once after the owner was cancelled")
+
+
+if __name__ == "__main__":
+    test_get_and_set()
+    test_concurrent_misses_coalesce()
+    test_errors_not_cached()
+    test_cacheable_predicate()
+    test_shared_redis_layer()
+    test_cross_worker_coalescing()
+    test_semantic_cache()
+    test_single_flight()
+    test_single_flight_owner_cancelled()
+    print("\n✅ All cache tests passed!")
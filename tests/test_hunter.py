@@ -3,6 +3,7 @@ Test Hunter.io service and API integration
 """
 
 import sys
+import subprocess
 from pathlib import Path
 import asyncio
 
@@ -130,7 +131,26 @@ def test_api_with_hunter():
     print("\n✅ All API + Hunter.io integration tests passed!")
 
 
+def test_flask_import():
+    """Test that the Flask app's copy of the service imports from the repo root"""
+    print("\nTesting services.hunter_service import for the Flask app...")
+    
+    # A fresh interpreter, so src/ (added to sys.path above) can't mask a
+    # missing module in the top-level services package
+    result = subprocess.run(
+        [sys.executable, "-c", "import services.hunter_service"],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    print("✓ services.hunter_service imports on its own")
+
+
 if __name__ == "__main__":
+    # Run import check
+    test_flask_import()
+    
     # Run async tests
     asyncio.run(test_hunter_service())
     
@@ -0,0 +1,48 @@
+"""
+Test progress broker relaying analysis updates to subscribers
+"""
+
+import sys
+from pathlib import Path
+import asyncio
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from progress import ProgressBroker
+
+
+def test_in_process_publish_subscribe():
+    """Test that subscribers receive updates for their progress id only"""
+    print("\n1. Testing in-process publish/subscribe...")
+
+    broker = ProgressBroker()
+
+    async def run():
+        async with broker.subscribe("a") as updates, broker.subscribe("b") as other:
+            await broker.publish("a", {"type": "progress", "progress": 20})
+            await broker.publish("a", {"type": "complete", "progress": 100})
+            received = [await updates.__anext__(), await updates.__anext__()]
+            other_queued = sum(queue.qsize() for queue in broker._subscribers["b"])
+            return received, other_queued
+
+    received, other_queued = asyncio.run(run())
+    assert [m["type"] for m in received] == ["progress", "complete"]
+    assert other_queued == 0, "Other progress ids should not receive the updates"
+    assert not broker._subscribers, "Subscriptions should be released on exit"
+    print("✓ Updates delivered in order and subscriptions released")
+
+
+def test_publish_without_subscribers():
+    """Test that publishing with nobody listening is a no-op"""
+    print("\n2. Testing publish without subscribers...")
+
+    broker = ProgressBroker()
+    asyncio.run(broker.publish("nobody", {"type": "progress", "progress": 20}))
+    assert not broker._subscribers
+    print("✓ Message dropped without error")
+
+
+if __name__ == "__main__":
+    test_in_process_publish_subscribe()
+    test_publish_without_subscribers()
+    print("\n✅ All progress tests passed!")
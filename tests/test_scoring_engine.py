@@ -7,7 +7,7 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from services.scoring_engine import AIReadinessScoringEngine, ScoringWeights
+from services.scoring_engine import AIReadinessScoringEngine, ScoringWeights, quick_hunter_score, quick_clearbit_score
 import json
 
 
@@ -473,6 +473,43 @@ def test_real_company_scenarios():
     assert result2['overall_score'] >= 70, "AI startup should score high"
 
 
+def test_quick_scores():
+    """Test the quick /analyze scoring used for Hunter.io and Clearbit data"""
+    print("\n16. Testing quick analyze scores...")
+    
+    sizes = [
+        ("10000+", 60),
+        ("1001-5000", 55),
+        ("1000-5000", 55),
+        ("51-200", 52),
+        ("201-500", 52),
+        ("11-50", 48)
+    ]
+    
+    for size, expected in sizes:
+        score = quick_hunter_score(size, None, None, None)
+        print(f"✓ Size {size}: {score} (expected {expected})")
+        assert score == expected, f"Quick size score mismatch for {size}"
+    
+    score = quick_hunter_score(
+        "10000+",
+        ["TensorFlow", "PyTorch", "Python", "AWS", "Docker", "Kubernetes"],
+        "Artificial Intelligence",
+        [{"seniority": "executive"}] * 5
+    )
+    print(f"✓ Strong Hunter.io profile: {score}")
+    assert score == 100, "Quick score should be capped at 100"
+    
+    assert quick_hunter_score(None, [], "Manufacturing", []) == 45
+    assert quick_hunter_score(None, None, "Banking", None) == 50
+    print("✓ Industry buckets applied")
+    
+    assert quick_clearbit_score(None, None) == 50
+    assert quick_clearbit_score(5000, ["scikit-learn"]) == 75
+    assert quick_clearbit_score(50, ["TensorFlow", "PyTorch", "Databricks", "OpenAI"]) == 80
+    print("✓ Clearbit quick scores calculated")
+
+
 def run_all_tests():
     """Run all scoring engine tests"""
     print("=" * 60)
@@ -494,7 +531,8 @@ def run_all_tests():
         test_confidence_calculation,
         test_strengths_weaknesses_identification,
         test_edge_cases,
-        test_real_company_scenarios
+        test_real_company_scenarios,
+        test_quick_scores
     ]
     
     passed = 0